@@ -1,19 +1,42 @@
 """Public interface for personalitygen."""
 
-from personalitygen.enums import LifeStage, PriorityLevel
-from personalitygen.personality import (
-    BigFiveConflictResolutionConfiguration,
-    BigFiveConflictResolutionStyle,
-    BigFivePersonality,
-    BigFiveTraitConfiguration,
-)
-from personalitygen.traits import (
-    BigFiveAgreeableness,
-    BigFiveConscientiousness,
-    BigFiveExtraversion,
-    BigFiveNeuroticism,
-    BigFiveOpenness,
-)
+from __future__ import annotations
+
+from importlib import import_module
+
+# Avoid importing ``typing`` at runtime; type checkers treat this as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from personalitygen.enums import LifeStage, PriorityLevel
+    from personalitygen.personality import (
+        BigFiveConflictResolutionConfiguration,
+        BigFiveConflictResolutionStyle,
+        BigFivePersonality,
+        BigFiveTraitConfiguration,
+    )
+    from personalitygen.traits import (
+        BigFiveAgreeableness,
+        BigFiveConscientiousness,
+        BigFiveExtraversion,
+        BigFiveNeuroticism,
+        BigFiveOpenness,
+    )
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package stays cheap for short-lived processes.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BigFiveAgreeableness": "personalitygen.traits",
+    "BigFiveConscientiousness": "personalitygen.traits",
+    "BigFiveConflictResolutionConfiguration": "personalitygen.personality",
+    "BigFiveConflictResolutionStyle": "personalitygen.personality",
+    "BigFiveExtraversion": "personalitygen.traits",
+    "BigFiveNeuroticism": "personalitygen.traits",
+    "BigFiveOpenness": "personalitygen.traits",
+    "BigFivePersonality": "personalitygen.personality",
+    "BigFiveTraitConfiguration": "personalitygen.personality",
+    "LifeStage": "personalitygen.enums",
+    "PriorityLevel": "personalitygen.enums",
+}
 
 __all__ = [
     "BigFiveAgreeableness",
@@ -28,3 +51,18 @@ __all__ = [
     "LifeStage",
     "PriorityLevel",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
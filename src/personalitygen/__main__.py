@@ -0,0 +1,7 @@
+"""Allow ``python -m personalitygen``."""
+
+import sys
+
+from personalitygen.cli import main
+
+sys.exit(main())
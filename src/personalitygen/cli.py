@@ -0,0 +1,335 @@
+"""Command-line generator for personalitygen.
+
+Personalities are generated in fixed-size chunks. With ``--seed`` each chunk
+draws from its own source seeded by the seed and the chunk index, so output
+is reproducible for a given seed and chunk size no matter how many workers
+are used.
+
+The ``binary`` format is a ``PGEN`` magic, a little-endian ``uint16``
+version and ``uint64`` record count, followed by one record per personality:
+fifteen little-endian ``float64`` scores in ``SCORE_COLUMNS`` order and a
+``uint8`` index into ``CONFLICT_STYLES``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import math
+import random
+import struct
+import sys
+from collections import Counter, deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import BinaryIO
+
+from personalitygen.enums import LifeStage
+from personalitygen.population import (
+    CONFLICT_STYLES,
+    SCORE_COLUMNS,
+    STYLE_COLUMN,
+    TRAIT_COLUMNS,
+    Population,
+    _stage_counts,
+    generate_population,
+)
+
+FORMATS = ("jsonl", "csv", "binary")
+
+BINARY_MAGIC = b"PGEN"
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sHQ")
+_BINARY_RECORD = struct.Struct(f"<{len(SCORE_COLUMNS)}dB")
+
+# Python float reprs are valid JSON numbers, so rows are formatted directly.
+_JSONL_TEMPLATE = (
+    "{{"
+    + ", ".join(f'"{column}": {{!r}}' for column in SCORE_COLUMNS)
+    + f', "{STYLE_COLUMN}": "{{}}"}}}}\n'
+)
+
+
+def _chunk_rng(seed: int | None, chunk_index: int) -> random.Random:
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{chunk_index}")
+
+
+_StageSpec = LifeStage | dict[LifeStage, float]
+_ChunkTask = tuple[int, int, int, _StageSpec, int | None]
+
+
+def _generate_chunk(task: _ChunkTask) -> Population:
+    chunk_index, start, count, life_stage, seed = task
+    return generate_population(
+        count,
+        life_stage,
+        rng=_chunk_rng(seed, chunk_index),
+        first_id=start,
+    )
+
+
+def _chunk_tasks(
+    count: int, chunk_size: int, life_stage: _StageSpec, seed: int | None
+) -> Iterator[_ChunkTask]:
+    # A stage mix is split across the whole run, not chunk by chunk, so
+    # small or partial chunks cannot skew it. Each chunk gets its exact
+    # stage counts, carried on from the chunks before it.
+    assigned: dict[LifeStage, int] = {}
+    for chunk_index in range(math.ceil(count / chunk_size)):
+        start = chunk_index * chunk_size
+        size = min(chunk_size, count - start)
+        chunk_stage = life_stage
+        if isinstance(life_stage, dict):
+            chunk_stage = _stage_counts(size, life_stage, assigned)
+            for stage, stage_count in chunk_stage.items():
+                assigned[stage] = assigned.get(stage, 0) + stage_count
+        yield chunk_index, start, size, chunk_stage, seed
+
+
+def _generate_chunks(
+    count: int,
+    life_stage: _StageSpec,
+    *,
+    seed: int | None,
+    chunk_size: int,
+    workers: int,
+) -> Iterator[Population]:
+    tasks = _chunk_tasks(count, chunk_size, life_stage, seed)
+    if workers <= 1:
+        yield from map(_generate_chunk, tasks)
+        return
+
+    # Keep a bounded window of chunks in flight so memory stays flat for
+    # huge counts while the output keeps chunk order.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[Population]] = deque()
+        for task in tasks:
+            pending.append(executor.submit(_generate_chunk, task))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _encode_jsonl(population: Population) -> bytes:
+    template = _JSONL_TEMPLATE.format
+    styles = [CONFLICT_STYLES[code].value for code in population.styles]
+    return "".join(
+        template(*row, style)
+        for row, style in zip(population.rows(), styles)
+    ).encode()
+
+
+def _encode_csv(population: Population) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    styles = [CONFLICT_STYLES[code].value for code in population.styles]
+    writer.writerows(
+        (*row, style) for row, style in zip(population.rows(), styles)
+    )
+    return buffer.getvalue().encode()
+
+
+def _encode_binary(population: Population) -> bytes:
+    pack = _BINARY_RECORD.pack
+    return b"".join(
+        pack(*row, style)
+        for row, style in zip(population.rows(), population.styles)
+    )
+
+
+_ENCODERS = {
+    "jsonl": _encode_jsonl,
+    "csv": _encode_csv,
+    "binary": _encode_binary,
+}
+
+
+def _write_header(stream: BinaryIO, output_format: str, count: int) -> None:
+    if output_format == "csv":
+        header = ",".join((*SCORE_COLUMNS, STYLE_COLUMN)) + "\n"
+        stream.write(header.encode())
+    elif output_format == "binary":
+        stream.write(_BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, count))
+
+
+class _Summary:
+    """Running per-trait moments and style counts across chunks."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sums = dict.fromkeys(TRAIT_COLUMNS, 0.0)
+        self.squares = dict.fromkeys(TRAIT_COLUMNS, 0.0)
+        self.styles: Counter[int] = Counter()
+
+    def update(self, population: Population) -> None:
+        self.count += len(population)
+        for trait in TRAIT_COLUMNS:
+            scores = population.trait_scores(trait)
+            self.sums[trait] += math.fsum(scores)
+            self.squares[trait] += math.fsum(score * score for score in scores)
+        self.styles.update(population.styles)
+
+    def format(self) -> str:
+        lines = [f"count: {self.count}"]
+        for trait in TRAIT_COLUMNS:
+            if self.count:
+                mean = self.sums[trait] / self.count
+                variance = self.squares[trait] / self.count - mean * mean
+                stdev = math.sqrt(max(variance, 0.0))
+            else:
+                mean = stdev = 0.0
+            lines.append(f"{trait}: mean={mean:.4f} stdev={stdev:.4f}")
+        lines.extend(
+            f"{style.value}: {self.styles[code]}"
+            for code, style in enumerate(CONFLICT_STYLES)
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def _stage_mix(value: str) -> dict[LifeStage, float]:
+    mix: dict[LifeStage, float] = {}
+    for entry in value.split(","):
+        stage, separator, weight = entry.partition("=")
+        try:
+            if not separator:
+                raise ValueError(entry)
+            life_stage = LifeStage(stage.strip())
+            parsed_weight = float(weight)
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(
+                f"expected stage=weight pairs, got {entry!r}"
+            ) from error
+        if life_stage in mix:
+            raise argparse.ArgumentTypeError(
+                f"stage {life_stage.value!r} is given more than once"
+            )
+        mix[life_stage] = parsed_weight
+    if not all(
+        math.isfinite(weight) and weight >= 0.0 for weight in mix.values()
+    ):
+        raise argparse.ArgumentTypeError(
+            "stage weights must be finite and non-negative"
+        )
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError(
+            "stage weights must not all be zero"
+        )
+    return mix
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be a non-negative integer")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="personalitygen",
+        description="Generate random Big Five personalities.",
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=_non_negative_int,
+        default=1,
+        help="number of personalities to generate (default: 1)",
+    )
+    stages = parser.add_mutually_exclusive_group()
+    stages.add_argument(
+        "--life-stage",
+        choices=[stage.value for stage in LifeStage],
+        default=LifeStage.ADULT.value,
+        help="life stage to sample for (default: adult)",
+    )
+    stages.add_argument(
+        "--stage-mix",
+        type=_stage_mix,
+        default=None,
+        metavar="STAGE=WEIGHT,...",
+        help="mix of life stages across the whole run, "
+        "e.g. child=20,young_adult=30,adult=50",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed for reproducible output",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="jsonl",
+        help="output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="output file, or '-' for stdout (default: -)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=10_000,
+        help="personalities generated and written per chunk "
+        "(default: 10000)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="write a summary of the generated population to stderr",
+    )
+    return parser
+
+
+def _write_population(stream: BinaryIO, args: argparse.Namespace) -> None:
+    encode = _ENCODERS[args.format]
+    summary = _Summary() if args.stats else None
+    _write_header(stream, args.format, args.count)
+    life_stage: _StageSpec = (
+        args.stage_mix
+        if args.stage_mix is not None
+        else LifeStage(args.life_stage)
+    )
+    for population in _generate_chunks(
+        args.count,
+        life_stage,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+    ):
+        stream.write(encode(population))
+        if summary is not None:
+            summary.update(population)
+    stream.flush()
+    if summary is not None:
+        sys.stderr.write(summary.format())
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.output == "-":
+        _write_population(sys.stdout.buffer, args)
+    else:
+        with open(args.output, "wb") as stream:
+            _write_population(stream, args)
+    return 0
@@ -0,0 +1,334 @@
+"""Correlated sub-trait sampling from per-life-stage correlation matrices."""
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections.abc import Mapping, Sequence
+from statistics import NormalDist
+from typing import Any
+
+from personalitygen.enums import LifeStage
+from personalitygen.personality import BigFiveTraitConfiguration
+from personalitygen.population import (
+    _TRAIT_SPECS,
+    SCORE_COLUMNS,
+    TRAIT_COLUMNS,
+    _column_samplers,
+)
+from personalitygen.randomness import (
+    RandomSource,
+    TruncatedGaussian,
+    _coerce_rng,
+)
+
+_NORMAL_CDF = NormalDist().cdf
+_SCORE_SIZE = len(SCORE_COLUMNS)
+_TRAIT_SIZE = len(TRAIT_COLUMNS)
+# Trait position of every score column, used to expand 5x5 matrices.
+_COLUMN_TRAITS = tuple(
+    trait
+    for trait, spec in enumerate(_TRAIT_SPECS)
+    for _ in spec.columns
+)
+
+
+def _validate_matrix(matrix: Sequence[Sequence[float]]) -> None:
+    size = len(matrix)
+    if size not in (_TRAIT_SIZE, _SCORE_SIZE):
+        raise ValueError(
+            f"Correlation matrices must be {_TRAIT_SIZE}x{_TRAIT_SIZE} or "
+            f"{_SCORE_SIZE}x{_SCORE_SIZE}"
+        )
+    if any(len(row) != size for row in matrix):
+        raise ValueError("Correlation matrices must be square")
+    for i in range(size):
+        if matrix[i][i] != 1.0:
+            raise ValueError("Correlation matrix diagonal must be 1.0")
+        for j in range(i):
+            if matrix[i][j] != matrix[j][i]:
+                raise ValueError("Correlation matrices must be symmetric")
+            if not (-1.0 <= matrix[i][j] <= 1.0):
+                raise ValueError(
+                    "Correlations must be in the range -1.0...1.0"
+                )
+
+
+def _expand_trait_matrix(
+    matrix: Sequence[Sequence[float]], facet_correlation: float
+) -> list[list[float]]:
+    # One-factor model: each sub-trait loads sqrt(facet_correlation) on its
+    # trait factor, and the trait factors correlate as given.
+    return [
+        [
+            1.0
+            if i == j
+            else facet_correlation
+            * matrix[_COLUMN_TRAITS[i]][_COLUMN_TRAITS[j]]
+            for j in range(_SCORE_SIZE)
+        ]
+        for i in range(_SCORE_SIZE)
+    ]
+
+
+def _cholesky(matrix: Sequence[Sequence[float]]) -> list[list[float]]:
+    size = len(matrix)
+    lower = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1):
+            total = matrix[i][j] - math.fsum(
+                lower[i][k] * lower[j][k] for k in range(j)
+            )
+            if i == j:
+                if total <= 0.0:
+                    raise ValueError(
+                        "Correlation matrix must be positive definite"
+                    )
+                lower[i][i] = math.sqrt(total)
+            else:
+                lower[i][j] = total / lower[j][j]
+    return lower
+
+
+class CorrelationModel:
+    """Correlations between sub-trait scores, one matrix per life stage.
+
+    Matrices are either 15x15 over ``SCORE_COLUMNS`` or 5x5 over the traits
+    of ``TRAIT_COLUMNS``. A 5x5 matrix is expanded with a one-factor model:
+    sub-traits of one trait correlate at ``facet_correlation`` and
+    sub-traits of traits A and B at ``facet_correlation * matrix[A][B]``.
+
+    Scores are drawn through a Gaussian copula: correlated standard normals
+    are mapped through the normal CDF onto each sub-trait's truncated
+    distribution, so every score keeps the marginal distribution of the
+    independent sampler. Each matrix is factorized once, here. With
+    ``vectorized=True`` batches are drawn with numpy, seeded from the given
+    random source.
+    """
+
+    def __init__(
+        self,
+        matrices: Mapping[LifeStage, Sequence[Sequence[float]]],
+        *,
+        facet_correlation: float = 0.5,
+        vectorized: bool = False,
+    ) -> None:
+        if not (0.0 <= facet_correlation < 1.0):
+            raise ValueError("facet_correlation must be in 0.0 <= x < 1.0")
+        if vectorized:
+            try:
+                import numpy  # noqa: F401
+            except ImportError as error:
+                raise ImportError(
+                    "Vectorized correlated sampling requires numpy"
+                ) from error
+        self.vectorized = vectorized
+        self._factors: dict[LifeStage, list[list[float]]] = {}
+        self._samplers: dict[LifeStage, list[TruncatedGaussian]] = {}
+        for life_stage, matrix in matrices.items():
+            _validate_matrix(matrix)
+            if len(matrix) == _TRAIT_SIZE:
+                matrix = _expand_trait_matrix(matrix, facet_correlation)
+            self._factors[life_stage] = _cholesky(matrix)
+            self._samplers[life_stage] = _column_samplers(life_stage)
+
+    @property
+    def life_stages(self) -> tuple[LifeStage, ...]:
+        return tuple(self._factors)
+
+    def _stage(
+        self, life_stage: LifeStage
+    ) -> tuple[list[list[float]], list[TruncatedGaussian]]:
+        factor = self._factors.get(life_stage)
+        if factor is None:
+            raise ValueError(
+                f"No correlation matrix for life stage: {life_stage}"
+            )
+        return factor, self._samplers[life_stage]
+
+    def sample_scores(
+        self, life_stage: LifeStage, *, rng: RandomSource | None = None
+    ) -> tuple[float, ...]:
+        """Draw one correlated score vector in ``SCORE_COLUMNS`` order."""
+        factor, samplers = self._stage(life_stage)
+        source = _coerce_rng(rng)
+        normal_cdf = _NORMAL_CDF
+        normals = [source.gauss(0.0, 1.0) for _ in range(_SCORE_SIZE)]
+        return tuple(
+            sampler.quantile(
+                normal_cdf(sum(map(operator.mul, row, normals)))
+            )
+            for row, sampler in zip(factor, samplers)
+        )
+
+    def sample_trait_configuration(
+        self, life_stage: LifeStage, *, rng: RandomSource | None = None
+    ) -> BigFiveTraitConfiguration:
+        scores = iter(self.sample_scores(life_stage, rng=rng))
+        return BigFiveTraitConfiguration(
+            **{
+                spec.name: spec.model(*(next(scores) for _ in spec.columns))
+                for spec in _TRAIT_SPECS
+            }
+        )
+
+    def sample_columns(
+        self,
+        count: int,
+        life_stage: LifeStage | Sequence[LifeStage],
+        *,
+        rng: RandomSource | None = None,
+    ) -> dict[str, array]:
+        """Draw ``count`` correlated score vectors as columns.
+
+        ``life_stage`` is one stage for every row or one stage per row.
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        if isinstance(life_stage, LifeStage):
+            present = [life_stage]
+            codes: Sequence[int] = [0] * count
+        else:
+            if len(life_stage) != count:
+                raise ValueError("life_stage must have one entry per row")
+            present = list(dict.fromkeys(life_stage))
+            stage_codes = {stage: code for code, stage in enumerate(present)}
+            codes = [stage_codes[stage] for stage in life_stage]
+        stages = [self._stage(stage) for stage in present]
+        source = _coerce_rng(rng)
+        if self.vectorized:
+            return _sample_columns_numpy(codes, stages, source)
+
+        normal_cdf = _NORMAL_CDF
+        gauss = source.gauss
+        # Per stage, pair each non-zero factor row with its quantile map.
+        tables = [
+            [
+                (tuple(row[: i + 1]), sampler.quantile)
+                for i, (row, sampler) in enumerate(zip(factor, samplers))
+            ]
+            for factor, samplers in stages
+        ]
+        columns = [array("d") for _ in SCORE_COLUMNS]
+        for code in codes:
+            normals = [gauss(0.0, 1.0) for _ in range(_SCORE_SIZE)]
+            for (row, quantile), column in zip(tables[code], columns):
+                normal = sum(map(operator.mul, row, normals))
+                column.append(quantile(normal_cdf(normal)))
+        return dict(zip(SCORE_COLUMNS, columns))
+
+
+# Rational approximations so the vectorized path needs only numpy.
+# Normal CDF: Abramowitz & Stegun 7.1.26 for erf, absolute error < 1.5e-7.
+_ERF_P = 0.3275911
+_ERF_A = (
+    0.254829592,
+    -0.284496736,
+    1.421413741,
+    -1.453152027,
+    1.061405429,
+)
+# Inverse normal CDF: Acklam's algorithm, relative error < 1.15e-9.
+_PPF_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_PPF_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+)
+_PPF_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_PPF_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+)
+_PPF_LOW = 0.02425
+
+
+def _polynomial(coefficients: Sequence[float], x: Any) -> Any:
+    result = coefficients[0]
+    for coefficient in coefficients[1:]:
+        result = result * x + coefficient
+    return result
+
+
+def _np_normal_cdf(x: Any) -> Any:
+    import numpy as np
+
+    z = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + _ERF_P * z)
+    erf = 1.0 - t * _polynomial(_ERF_A[::-1], t) * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _np_normal_ppf(p: Any) -> Any:
+    import numpy as np
+
+    result = np.empty_like(p)
+    low = p < _PPF_LOW
+    high = p > 1.0 - _PPF_LOW
+    central = ~(low | high)
+
+    q = p[central] - 0.5
+    r = q * q
+    result[central] = (
+        _polynomial(_PPF_A, r) * q / (_polynomial((*_PPF_B, 1.0), r))
+    )
+    tails = ((low, p[low], 1.0), (high, 1.0 - p[high], -1.0))
+    for mask, tail, sign in tails:
+        q = np.sqrt(-2.0 * np.log(tail))
+        result[mask] = sign * (
+            _polynomial(_PPF_C, q) / _polynomial((*_PPF_D, 1.0), q)
+        )
+    return result
+
+
+def _sample_columns_numpy(
+    codes: Sequence[int],
+    stages: Sequence[tuple[list[list[float]], list[TruncatedGaussian]]],
+    source: RandomSource,
+) -> dict[str, array]:
+    import numpy as np
+
+    generator = np.random.default_rng(int(source.uniform(0.0, 2.0**53)))
+    stage_codes = np.asarray(codes, dtype=np.intp)
+    scores = np.empty((len(stage_codes), _SCORE_SIZE))
+    for code, (factor, samplers) in enumerate(stages):
+        rows = np.flatnonzero(stage_codes == code)
+        normals = generator.standard_normal((len(rows), _SCORE_SIZE))
+        probabilities = _np_normal_cdf(normals @ np.asarray(factor).T)
+        for position, sampler in enumerate(samplers):
+            probability_range = sampler.probability_range
+            if probability_range is None:
+                values = np.full(len(rows), sampler.quantile(0.5))
+            else:
+                lower, upper = probability_range
+                values = sampler.mean + sampler.stddev * _np_normal_ppf(
+                    lower + (upper - lower) * probabilities[:, position]
+                )
+                values = np.clip(
+                    values, sampler.min_value, sampler.max_value
+                )
+            scores[rows, position] = values
+
+    return {
+        column: array("d", np.ascontiguousarray(scores[:, position]).tobytes())
+        for position, column in enumerate(SCORE_COLUMNS)
+    }
@@ -0,0 +1,374 @@
+"""Diff and patch columnar population snapshots."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from personalitygen.population import (
+    SCORE_COLUMNS,
+    STYLE_COLUMN,
+    Population,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnPatch:
+    """New values for some rows of one column.
+
+    ``indices`` are row positions in the base snapshot. ``column`` is a
+    name from ``SCORE_COLUMNS`` or ``STYLE_COLUMN``.
+    """
+
+    column: str
+    indices: Sequence[int]
+    values: Sequence[float]
+
+
+@dataclass(frozen=True, slots=True)
+class PopulationPatch:
+    """Changes that turn one population snapshot into a later one.
+
+    Applying a patch updates changed cells in place of the base rows, drops
+    ``removed_ids`` and appends ``added``, so row order follows the base
+    snapshot rather than the later one.
+    """
+
+    changes: tuple[ColumnPatch, ...]
+    removed_ids: Sequence[int]
+    added: Population | None = None
+
+    @property
+    def changed_cells(self) -> int:
+        return sum(len(change.indices) for change in self.changes)
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            not self.changes
+            and len(self.removed_ids) == 0
+            and (self.added is None or not len(self.added))
+        )
+
+
+def _tolerances(tolerance: float | Mapping[str, float]) -> dict[str, float]:
+    if isinstance(tolerance, Mapping):
+        unknown = sorted(set(tolerance) - set(SCORE_COLUMNS))
+        if unknown:
+            raise ValueError(f"Unknown score columns: {unknown}")
+        tolerances = {column: 0.0 for column in SCORE_COLUMNS}
+        tolerances.update(tolerance)
+    else:
+        tolerances = dict.fromkeys(SCORE_COLUMNS, tolerance)
+    if any(value < 0.0 for value in tolerances.values()):
+        raise ValueError("tolerance must be non-negative")
+    return tolerances
+
+
+def _changed_rows(
+    old: Sequence[float],
+    new: Sequence[float],
+    tolerance: float,
+) -> list[int]:
+    if tolerance:
+        return [
+            index
+            for index, (before, after) in enumerate(zip(old, new))
+            if abs(after - before) > tolerance
+        ]
+    return [
+        index
+        for index, (before, after) in enumerate(zip(old, new))
+        if after != before
+    ]
+
+
+def _take(values: Sequence[float], positions: Sequence[int]) -> list[float]:
+    return [values[position] for position in positions]
+
+
+def _equal(first: Sequence[float], second: Sequence[float]) -> bool:
+    if len(first) != len(second):
+        return False
+    result = first == second
+    if isinstance(result, bool):
+        return result
+    # numpy arrays compare element-wise.
+    return bool(result.all())
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("Vectorized diffing requires numpy") from error
+    return numpy
+
+
+def diff_populations(
+    old: Population,
+    new: Population,
+    *,
+    tolerance: float | Mapping[str, float] = 0.0,
+    vectorized: bool = False,
+) -> PopulationPatch:
+    """Describe how ``new`` differs from ``old``, matching rows by agent ID.
+
+    Scores that moved by no more than their tolerance (one value for every
+    column or a per-column mapping) are not reported, so diff against the
+    snapshot a replica actually holds to keep drift bounded. Matching by ID
+    requires the IDs within each snapshot to be unique.
+
+    Columns that are equal as a whole are skipped without visiting their
+    rows, but every other column is compared row by row in Python, so the
+    cost grows with the population size rather than the number of changes.
+    With ``vectorized=True`` the comparison runs in numpy instead.
+    """
+    tolerances = _tolerances(tolerance)
+    if vectorized:
+        _import_numpy()
+    if _equal(old.ids, new.ids):
+        # Same agents in the same order: compare row by row.
+        old_positions: Sequence[int] = range(len(old))
+        new_positions: Sequence[int] = range(len(new))
+        removed_ids: Sequence[int] = array("Q")
+        added = None
+        aligned = True
+    else:
+        new_index = {
+            agent_id: position for position, agent_id in enumerate(new.ids)
+        }
+        if len(new_index) != len(new):
+            raise ValueError("New snapshot has duplicate agent IDs")
+        if len(set(old.ids)) != len(old):
+            raise ValueError("Old snapshot has duplicate agent IDs")
+        old_positions = array("Q")
+        new_positions = array("Q")
+        removed_ids = array("Q")
+        for position, agent_id in enumerate(old.ids):
+            match = new_index.pop(agent_id, None)
+            if match is None:
+                removed_ids.append(agent_id)
+            else:
+                old_positions.append(position)
+                new_positions.append(match)
+        added = _select_rows(new, sorted(new_index.values()))
+        aligned = False
+
+    columns = [
+        (column, old.columns[column], new.columns[column], tolerances[column])
+        for column in SCORE_COLUMNS
+    ]
+    columns.append((STYLE_COLUMN, old.styles, new.styles, 0.0))
+    if vectorized:
+        return PopulationPatch(
+            changes=tuple(
+                _changed_columns_numpy(
+                    columns, old_positions, new_positions, aligned
+                )
+            ),
+            removed_ids=removed_ids,
+            added=added,
+        )
+
+    changes: list[ColumnPatch] = []
+    for column, before, after, column_tolerance in columns:
+        typecode = "B" if column == STYLE_COLUMN else "d"
+        if aligned:
+            if _equal(before, after):
+                continue
+        else:
+            before = _take(before, old_positions)
+            after = _take(after, new_positions)
+        rows = _changed_rows(before, after, column_tolerance)
+        if rows:
+            changes.append(
+                ColumnPatch(
+                    column=column,
+                    indices=array(
+                        "Q",
+                        rows if aligned else _take(old_positions, rows),
+                    ),
+                    values=array(typecode, _take(after, rows)),
+                )
+            )
+
+    return PopulationPatch(
+        changes=tuple(changes), removed_ids=removed_ids, added=added
+    )
+
+
+def _changed_columns_numpy(
+    columns: Sequence[tuple[str, Sequence[float], Sequence[float], float]],
+    old_positions: Sequence[int],
+    new_positions: Sequence[int],
+    aligned: bool,
+) -> list[ColumnPatch]:
+    import numpy as np
+
+    if not aligned:
+        old_rows = np.asarray(old_positions, dtype=np.intp)
+        new_rows = np.asarray(new_positions, dtype=np.intp)
+    changes: list[ColumnPatch] = []
+    for column, before, after, column_tolerance in columns:
+        typecode = "B" if column == STYLE_COLUMN else "d"
+        dtype = np.uint8 if column == STYLE_COLUMN else np.float64
+        # array and memoryview columns are wrapped without copying.
+        old_values = np.asarray(before, dtype=dtype)
+        new_values = np.asarray(after, dtype=dtype)
+        if not aligned:
+            old_values = old_values[old_rows]
+            new_values = new_values[new_rows]
+        if column_tolerance:
+            changed = np.abs(new_values - old_values) > column_tolerance
+        else:
+            changed = new_values != old_values
+        rows = np.flatnonzero(changed)
+        if rows.size:
+            indices = rows if aligned else old_rows[rows]
+            changes.append(
+                ColumnPatch(
+                    column=column,
+                    indices=array(
+                        "Q", indices.astype(np.uint64).tobytes()
+                    ),
+                    values=array(typecode, new_values[rows].tobytes()),
+                )
+            )
+    return changes
+
+
+def _select_rows(
+    population: Population, positions: Sequence[int]
+) -> Population:
+    return Population(
+        columns={
+            column: array("d", _take(values, positions))
+            for column, values in population.columns.items()
+        },
+        styles=array("B", _take(population.styles, positions)),
+        ids=array("Q", _take(population.ids, positions)),
+    )
+
+
+def apply_patch(
+    base: Population, patch: PopulationPatch, *, vectorized: bool = False
+) -> Population:
+    """Return ``base`` with ``patch`` applied; ``base`` is left untouched.
+
+    Cell updates touch only the changed rows, but leaving ``base`` intact
+    means every column is copied once, and removing agents compacts every
+    column in Python. With ``vectorized=True`` the copy, the updates and
+    the compaction run in numpy instead.
+    """
+    if vectorized:
+        _import_numpy()
+        return _apply_patch_numpy(base, patch)
+
+    columns = {
+        column: array("d", values) for column, values in base.columns.items()
+    }
+    styles = array("B", base.styles)
+    ids = array("Q", base.ids)
+
+    size = len(base)
+    for change in patch.changes:
+        if change.column == STYLE_COLUMN:
+            target = styles
+        elif change.column in columns:
+            target = columns[change.column]
+        else:
+            raise ValueError(f"Unknown patch column: {change.column}")
+        for index, value in zip(change.indices, change.values):
+            if not (0 <= index < size):
+                raise ValueError("Patch index is outside the population")
+            target[index] = value
+
+    patched = Population(columns=columns, styles=styles, ids=ids)
+    if len(patch.removed_ids):
+        removed = set(patch.removed_ids)
+        patched = _select_rows(
+            patched,
+            [
+                position
+                for position, agent_id in enumerate(ids)
+                if agent_id not in removed
+            ],
+        )
+    if patch.added is not None and len(patch.added):
+        if not set(patched.ids).isdisjoint(patch.added.ids):
+            raise ValueError("Patch adds agent IDs that are already present")
+        patched = _concat(patched, patch.added)
+    return patched
+
+
+def _concat(first: Population, second: Population) -> Population:
+    columns = {}
+    for column in SCORE_COLUMNS:
+        values = array("d", first.columns[column])
+        values.extend(second.columns[column])
+        columns[column] = values
+    styles = array("B", first.styles)
+    styles.extend(second.styles)
+    ids = array("Q", first.ids)
+    ids.extend(second.ids)
+    return Population(columns=columns, styles=styles, ids=ids)
+
+
+def _apply_patch_numpy(
+    base: Population, patch: PopulationPatch
+) -> Population:
+    import numpy as np
+
+    columns = {
+        column: np.array(values, dtype=np.float64)
+        for column, values in base.columns.items()
+    }
+    styles = np.array(base.styles, dtype=np.uint8)
+    ids = np.array(base.ids, dtype=np.uint64)
+
+    for change in patch.changes:
+        if change.column == STYLE_COLUMN:
+            target = styles
+        elif change.column in columns:
+            target = columns[change.column]
+        else:
+            raise ValueError(f"Unknown patch column: {change.column}")
+        indices = np.asarray(change.indices, dtype=np.intp)
+        if indices.size and (
+            indices.min() < 0 or indices.max() >= len(ids)
+        ):
+            raise ValueError("Patch index is outside the population")
+        target[indices] = np.asarray(change.values, dtype=target.dtype)
+
+    if len(patch.removed_ids):
+        keep = ~np.isin(ids, np.asarray(patch.removed_ids, dtype=np.uint64))
+        columns = {column: values[keep] for column, values in columns.items()}
+        styles = styles[keep]
+        ids = ids[keep]
+    added = patch.added
+    if added is not None and len(added):
+        added_ids = np.asarray(added.ids, dtype=np.uint64)
+        if np.isin(added_ids, ids).any():
+            raise ValueError("Patch adds agent IDs that are already present")
+        columns = {
+            column: np.concatenate(
+                (values, np.asarray(added.columns[column], dtype=np.float64))
+            )
+            for column, values in columns.items()
+        }
+        styles = np.concatenate(
+            (styles, np.asarray(added.styles, dtype=np.uint8))
+        )
+        ids = np.concatenate((ids, added_ids))
+
+    return Population(
+        columns={
+            column: array("d", values.tobytes())
+            for column, values in columns.items()
+        },
+        styles=array("B", styles.tobytes()),
+        ids=array("Q", ids.tobytes()),
+    )
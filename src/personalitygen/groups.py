@@ -0,0 +1,406 @@
+"""Select groups from a population that meet composition constraints."""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+from personalitygen.enums import PriorityLevel
+from personalitygen.personality import (
+    _STYLE_TO_CONCERNS,
+    BigFiveConflictResolutionStyle,
+)
+from personalitygen.population import (
+    CONFLICT_STYLES,
+    TRAIT_COLUMNS,
+    Population,
+)
+from personalitygen.randomness import (
+    RandomSource,
+    _coerce_rng,
+    _random_index,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Bounds:
+    """Inclusive range; ``None`` leaves that side open."""
+
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def __post_init__(self) -> None:
+        if (
+            self.minimum is not None
+            and self.maximum is not None
+            and self.minimum > self.maximum
+        ):
+            raise ValueError("minimum must be <= maximum")
+
+    def violation(self, value: float) -> float:
+        if self.minimum is not None and value < self.minimum:
+            return self.minimum - value
+        if self.maximum is not None and value > self.maximum:
+            return value - self.maximum
+        return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class GroupConstraints:
+    """Constraints a selected group must satisfy.
+
+    Style and concern bounds limit how many members have that conflict
+    resolution style or concern level; trait bounds limit the group's mean
+    aggregate score for the named trait (see ``TRAIT_COLUMNS``).
+    """
+
+    style_counts: Mapping[BigFiveConflictResolutionStyle, Bounds] = field(
+        default_factory=dict
+    )
+    concern_for_self_counts: Mapping[PriorityLevel, Bounds] = field(
+        default_factory=dict
+    )
+    concern_for_others_counts: Mapping[PriorityLevel, Bounds] = field(
+        default_factory=dict
+    )
+    trait_means: Mapping[str, Bounds] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class GroupObjective:
+    """Linear objective over trait means and spreads, to be maximized.
+
+    Spread is the population standard deviation of a trait within the
+    group, so a positive weight favors diverse groups and a negative weight
+    favors homogeneous ones.
+    """
+
+    trait_mean_weights: Mapping[str, float] = field(default_factory=dict)
+    trait_spread_weights: Mapping[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class GroupSelection:
+    indices: tuple[int, ...]
+    objective: float
+    # Total amount by which the constraints are missed; 0.0 when feasible.
+    violation: float
+
+    @property
+    def feasible(self) -> bool:
+        return self.violation == 0.0
+
+
+def _style_bounds_per_code(
+    constraints: GroupConstraints,
+) -> list[tuple[Sequence[int], Bounds]]:
+    """Express every count constraint as bounds over sums of style codes."""
+    bounds: list[tuple[Sequence[int], Bounds]] = [
+        ((CONFLICT_STYLES.index(style),), style_bounds)
+        for style, style_bounds in constraints.style_counts.items()
+    ]
+    for position, counts in (
+        (0, constraints.concern_for_self_counts),
+        (1, constraints.concern_for_others_counts),
+    ):
+        for level, level_bounds in counts.items():
+            codes = tuple(
+                code
+                for code, style in enumerate(CONFLICT_STYLES)
+                if _STYLE_TO_CONCERNS[style][position] == level
+            )
+            bounds.append((codes, level_bounds))
+    return bounds
+
+
+class _GroupState:
+    """Running style counts and trait moments for incremental scoring."""
+
+    def __init__(
+        self,
+        styles: Sequence[int],
+        trait_scores: dict[str, list[float]],
+        constraints: GroupConstraints,
+        objective: GroupObjective,
+    ) -> None:
+        self.styles = styles
+        self.trait_scores = trait_scores
+        self.count_bounds = _style_bounds_per_code(constraints)
+        self.trait_bounds = dict(constraints.trait_means)
+        self.mean_weights = dict(objective.trait_mean_weights)
+        self.spread_weights = dict(objective.trait_spread_weights)
+        self.size = 0
+        self.style_counts = [0] * len(CONFLICT_STYLES)
+        self.sums = dict.fromkeys(trait_scores, 0.0)
+        self.squares = dict.fromkeys(trait_scores, 0.0)
+
+    def add(self, index: int) -> None:
+        self.size += 1
+        self.style_counts[self.styles[index]] += 1
+        for trait, scores in self.trait_scores.items():
+            score = scores[index]
+            self.sums[trait] += score
+            self.squares[trait] += score * score
+
+    def remove(self, index: int) -> None:
+        self.size -= 1
+        self.style_counts[self.styles[index]] -= 1
+        for trait, scores in self.trait_scores.items():
+            score = scores[index]
+            self.sums[trait] -= score
+            self.squares[trait] -= score * score
+
+    def evaluate(self) -> tuple[float, float]:
+        """Return ``(violation, objective)`` for the current members."""
+        violation = 0.0
+        for codes, bounds in self.count_bounds:
+            count = sum(self.style_counts[code] for code in codes)
+            violation += bounds.violation(count)
+
+        objective = 0.0
+        if self.size:
+            for trait, bounds in self.trait_bounds.items():
+                violation += bounds.violation(self.sums[trait] / self.size)
+            for trait, weight in self.mean_weights.items():
+                objective += weight * self.sums[trait] / self.size
+            for trait, weight in self.spread_weights.items():
+                mean = self.sums[trait] / self.size
+                variance = self.squares[trait] / self.size - mean * mean
+                objective += weight * math.sqrt(max(variance, 0.0))
+        return violation, objective
+
+    def evaluate_swap(
+        self, outgoing: int | None, incoming: int
+    ) -> tuple[float, float]:
+        if outgoing is not None:
+            self.remove(outgoing)
+        self.add(incoming)
+        result = self.evaluate()
+        self.remove(incoming)
+        if outgoing is not None:
+            self.add(outgoing)
+        return result
+
+
+def _is_better(
+    candidate: tuple[float, float], incumbent: tuple[float, float]
+) -> bool:
+    # Feasibility first, then the objective.
+    if candidate[0] != incumbent[0]:
+        return candidate[0] < incumbent[0]
+    return candidate[1] > incumbent[1]
+
+
+def _validate_traits(names: Sequence[str]) -> None:
+    unknown = sorted(set(names) - set(TRAIT_COLUMNS))
+    if unknown:
+        raise ValueError(f"Unknown traits: {unknown}")
+
+
+class _CandidateSampler:
+    """Draw unused indices, favoring styles below their minimum count.
+
+    Unused indices live in a pool with a position map, so taking or
+    releasing one is a swap-remove or an append and every draw from the
+    pool hits an unused index, however few are left.
+    """
+
+    def __init__(
+        self,
+        population: Population,
+        state: _GroupState,
+        source: RandomSource,
+    ) -> None:
+        self.population = population
+        self.state = state
+        self.source = source
+        self._unused = array("Q", range(len(population)))
+        self._positions = array("Q", range(len(population)))
+        self._by_style: list[list[int]] | None = None
+
+    def is_unused(self, index: int) -> bool:
+        position = self._positions[index]
+        return position < len(self._unused) and (
+            self._unused[position] == index
+        )
+
+    def take(self, index: int) -> None:
+        position = self._positions[index]
+        last = self._unused.pop()
+        if last != index:
+            self._unused[position] = last
+            self._positions[last] = position
+
+    def release(self, index: int) -> None:
+        self._positions[index] = len(self._unused)
+        self._unused.append(index)
+
+    def _styles_below_minimum(self) -> list[int]:
+        short: list[int] = []
+        for codes, bounds in self.state.count_bounds:
+            if bounds.minimum is None:
+                continue
+            count = sum(self.state.style_counts[code] for code in codes)
+            if count < bounds.minimum:
+                short.extend(codes)
+        return short
+
+    def _style_bucket(self, code: int) -> list[int]:
+        if self._by_style is None:
+            # Built on first need only; most constraint sets never need it.
+            self._by_style = [[] for _ in CONFLICT_STYLES]
+            for index, style in enumerate(self.population.styles):
+                self._by_style[style].append(index)
+        return self._by_style[code]
+
+    def sample(self, count: int) -> list[int]:
+        candidates: list[int] = []
+        unused = self._unused
+        if not unused:
+            return candidates
+        short = self._styles_below_minimum()
+        while len(candidates) < count:
+            # Alternate between short styles and the whole unused pool; a
+            # style probe that lands on a used index falls back to the pool.
+            index = None
+            if short and len(candidates) % 2 == 0:
+                code = short[_random_index(self.source, len(short))]
+                bucket = self._style_bucket(code)
+                if not bucket:
+                    short.remove(code)
+                    continue
+                index = bucket[_random_index(self.source, len(bucket))]
+            if index is None or not self.is_unused(index):
+                index = unused[_random_index(self.source, len(unused))]
+            candidates.append(index)
+        return candidates
+
+
+def _select_group(
+    sampler: _CandidateSampler,
+    size: int,
+    *,
+    candidates_per_step: int,
+    max_iterations: int,
+    deadline: float,
+) -> list[int]:
+    state = sampler.state
+    members: list[int] = []
+    # Greedy construction: add the best of a candidate sample each step.
+    while len(members) < size:
+        best: int | None = None
+        best_key: tuple[float, float] | None = None
+        for candidate in sampler.sample(candidates_per_step):
+            key = state.evaluate_swap(None, candidate)
+            if best_key is None or _is_better(key, best_key):
+                best, best_key = candidate, key
+        if best is None:
+            raise ValueError("Not enough unused personalities to fill group")
+        members.append(best)
+        state.add(best)
+        sampler.take(best)
+
+    # Local search: swap a member for a sampled outsider when it helps.
+    current = state.evaluate()
+    for _ in range(max_iterations):
+        if time.perf_counter() >= deadline:
+            break
+        candidates = sampler.sample(1)
+        if not candidates:
+            # Every personality is already in a group; no swap is possible.
+            break
+        position = _random_index(sampler.source, size)
+        outgoing = members[position]
+        incoming = candidates[0]
+        key = state.evaluate_swap(outgoing, incoming)
+        if _is_better(key, current):
+            state.remove(outgoing)
+            state.add(incoming)
+            sampler.release(outgoing)
+            sampler.take(incoming)
+            members[position] = incoming
+            current = key
+    return members
+
+
+def select_groups(
+    population: Population,
+    size: int,
+    *,
+    count: int = 1,
+    constraints: GroupConstraints | None = None,
+    objective: GroupObjective | None = None,
+    rng: RandomSource | None = None,
+    candidates_per_step: int = 256,
+    max_iterations: int = 20_000,
+    time_budget: float | None = 1.0,
+) -> list[GroupSelection]:
+    """Pick ``count`` disjoint groups of ``size`` personalities.
+
+    Each group is built greedily from sampled candidates and then improved
+    by random member swaps, scoring every move incrementally from running
+    style counts and trait moments. Meeting the constraints takes priority
+    over the objective. ``time_budget`` (seconds per group) and
+    ``max_iterations`` bound the local search; a seeded ``rng`` gives
+    reproducible groups as long as the time budget is not what stops it.
+    """
+    constraints = constraints if constraints is not None else (
+        GroupConstraints()
+    )
+    objective = objective if objective is not None else GroupObjective()
+    if size <= 0:
+        raise ValueError("size must be positive")
+    if count <= 0:
+        raise ValueError("count must be positive")
+    if size * count > len(population):
+        raise ValueError("Population is too small for the requested groups")
+    if candidates_per_step <= 0:
+        raise ValueError("candidates_per_step must be positive")
+
+    traits = {
+        *constraints.trait_means,
+        *objective.trait_mean_weights,
+        *objective.trait_spread_weights,
+    }
+    _validate_traits(sorted(traits))
+    # Only the traits the search looks at are aggregated from the columns.
+    trait_scores = {
+        trait: population.trait_scores(trait) for trait in sorted(traits)
+    }
+
+    def new_state() -> _GroupState:
+        return _GroupState(
+            population.styles, trait_scores, constraints, objective
+        )
+
+    sampler = _CandidateSampler(population, new_state(), _coerce_rng(rng))
+    selections: list[GroupSelection] = []
+    for _ in range(count):
+        sampler.state = new_state()
+        deadline = (
+            math.inf
+            if time_budget is None
+            else time.perf_counter() + time_budget
+        )
+        members = _select_group(
+            sampler,
+            size,
+            candidates_per_step=candidates_per_step,
+            max_iterations=max_iterations,
+            deadline=deadline,
+        )
+        # Rescore from scratch so the reported numbers carry no drift from
+        # the incremental updates.
+        final = new_state()
+        for index in members:
+            final.add(index)
+        violation, score = final.evaluate()
+        selections.append(
+            GroupSelection(
+                indices=tuple(members), objective=score, violation=violation
+            )
+        )
+    return selections
@@ -0,0 +1,177 @@
+"""Quantized generation with shared, interned model instances."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TypeVar
+
+from personalitygen.constants import UNIT_RANGE_MAX, UNIT_RANGE_MIN
+from personalitygen.enums import LifeStage
+from personalitygen.personality import (
+    _STYLE_TO_CONCERNS,
+    BigFiveConflictResolutionConfiguration,
+    BigFiveConflictResolutionStyle,
+    BigFivePersonality,
+    BigFiveTraitConfiguration,
+)
+from personalitygen.population import _TRAIT_SPECS, Population
+from personalitygen.randomness import RandomSource
+from personalitygen.traits import _sample_trait
+
+TraitT = TypeVar("TraitT")
+
+# Only five conflict configurations can exist, so they are shared outright.
+_CONFLICT_CONFIGURATIONS: dict[
+    BigFiveConflictResolutionStyle, BigFiveConflictResolutionConfiguration
+] = {
+    style: BigFiveConflictResolutionConfiguration(
+        conflict_resolution_style=style,
+        concern_for_self=concern_for_self,
+        concern_for_others=concern_for_others,
+    )
+    for style, (
+        concern_for_self,
+        concern_for_others,
+    ) in _STYLE_TO_CONCERNS.items()
+}
+
+
+def shared_conflict_configuration(
+    style: BigFiveConflictResolutionStyle,
+) -> BigFiveConflictResolutionConfiguration:
+    """Return the single shared configuration for ``style``."""
+    return _CONFLICT_CONFIGURATIONS[style]
+
+
+class TraitInterner:
+    """Quantizes trait scores and hands out shared frozen model instances.
+
+    Scores are rounded to ``resolution``, and traits, trait configurations
+    and personalities are looked up in one least-recently-used cache of at
+    most ``maxsize`` entries before any object is built. While an entry is
+    cached, every equal quantized value is that same object, so ``is`` is
+    the supported (and cheapest) way to compare interned results; ``==``
+    still compares field by field.
+    """
+
+    def __init__(
+        self, *, resolution: float = 0.01, maxsize: int = 65_536
+    ) -> None:
+        if not (0.0 < resolution <= UNIT_RANGE_MAX):
+            raise ValueError("resolution must be in the range (0.0, 1.0]")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.resolution = resolution
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[object, ...], object] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, value: float) -> float:
+        steps = round(value / self.resolution)
+        # Rounding again strips float noise such as 0.07000000000000001.
+        quantized = round(steps * self.resolution, 12)
+        return max(UNIT_RANGE_MIN, min(UNIT_RANGE_MAX, quantized))
+
+    def _intern(
+        self, key: tuple[object, ...], build: Callable[[], object]
+    ) -> object:
+        cache = self._cache
+        instance = cache.get(key)
+        if instance is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return instance
+
+        self.misses += 1
+        instance = build()
+        cache[key] = instance
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return instance
+
+    def trait(
+        self, model: type[TraitT], scores: tuple[float, float, float]
+    ) -> TraitT:
+        """Return the shared ``model`` instance for the quantized scores."""
+        quantize = self.quantize
+        fields = tuple(quantize(score) for score in scores)
+        return self._intern(  # type: ignore[return-value]
+            (model, *fields), lambda: model(*fields)
+        )
+
+    # Parents are keyed by the id() of their interned children, so lookups
+    # never hash a trait tree. The cached parent keeps those children
+    # alive, so their ids cannot be reused while the entry exists.
+    def _trait_configuration(
+        self, traits: dict[str, object]
+    ) -> BigFiveTraitConfiguration:
+        children = [traits[spec.name] for spec in _TRAIT_SPECS]
+        return self._intern(  # type: ignore[return-value]
+            (BigFiveTraitConfiguration, *map(id, children)),
+            lambda: BigFiveTraitConfiguration(*children),
+        )
+
+    def _personality(
+        self,
+        trait_configuration: BigFiveTraitConfiguration,
+        style: BigFiveConflictResolutionStyle,
+    ) -> BigFivePersonality:
+        return self._intern(  # type: ignore[return-value]
+            (BigFivePersonality, id(trait_configuration), style),
+            lambda: BigFivePersonality(
+                trait_configuration=trait_configuration,
+                conflict_resolution_configuration=(
+                    shared_conflict_configuration(style)
+                ),
+            ),
+        )
+
+    def trait_configuration(
+        self, life_stage: LifeStage, *, rng: RandomSource | None = None
+    ) -> BigFiveTraitConfiguration:
+        """Sample like :meth:`BigFiveTraitConfiguration.random`, quantized."""
+        return self._trait_configuration(
+            {
+                spec.name: self.trait(
+                    spec.model, _sample_trait(life_stage, spec.config, rng=rng)
+                )
+                for spec in _TRAIT_SPECS
+            }
+        )
+
+    def personality(
+        self, life_stage: LifeStage, *, rng: RandomSource | None = None
+    ) -> BigFivePersonality:
+        """Sample like :meth:`BigFivePersonality.random`, quantized."""
+        trait_configuration = self.trait_configuration(life_stage, rng=rng)
+        style = BigFiveConflictResolutionStyle.random(
+            trait_configuration, rng=rng
+        )
+        return self._personality(trait_configuration, style)
+
+    def population_personality(
+        self, population: Population, index: int
+    ) -> BigFivePersonality:
+        """Build a quantized model view of one population member."""
+        columns = population.columns
+        traits = {
+            spec.name: self.trait(
+                spec.model,
+                tuple(columns[column][index] for column in spec.columns),
+            )
+            for spec in _TRAIT_SPECS
+        }
+        return self._personality(
+            self._trait_configuration(traits),
+            population.conflict_style(index),
+        )
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
 from enum import Enum
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from personalitygen.enums import LifeStage, PriorityLevel
-from personalitygen.randomness import RandomSource
+from personalitygen.randomness import RandomSource, _coerce_rng
 from personalitygen.traits import (
     BigFiveAgreeableness,
     BigFiveConscientiousness,
@@ -17,6 +16,9 @@ from personalitygen.traits import (
     BigFiveOpenness,
 )
 
+if TYPE_CHECKING:
+    from personalitygen.correlation import CorrelationModel
+
 
 def _weighted_choice(
     weights: dict["BigFiveConflictResolutionStyle", float],
@@ -27,7 +29,7 @@ def _weighted_choice(
         raise ValueError("weights must be non-empty")
     if any(weight < 0.0 for weight in weights.values()):
         raise ValueError("weights must be non-negative")
-    source = rng if rng is not None else random
+    source = _coerce_rng(rng)
     total = sum(weights.values())
     if total <= 0.0:
         weights = {style: 1.0 for style in weights}
@@ -60,39 +62,58 @@ class BigFiveConflictResolutionStyle(str, Enum):
         *,
         rng: RandomSource | None = None,
     ) -> Self:
-        # These weights are loosely based on:
-        # Priyadarshini, S. (2017). Effect of Personality on Conflict
-        # Resolution Styles. IRA-International Journal of Management &
-        # Social Sciences, 7(2), 196-207.
-        style_levels = {
-            cls.AVOIDING: trait_configuration.neuroticism.score * 0.7
-            + trait_configuration.openness.score * -0.1
-            + trait_configuration.agreeableness.score * 0.2
-            + trait_configuration.conscientiousness.score * -0.2,
-            cls.OBLIGING: trait_configuration.neuroticism.score * 0.2
-            + trait_configuration.extraversion.score * -0.2
-            + trait_configuration.openness.score * -0.1
-            + trait_configuration.agreeableness.score * 0.3,
-            cls.INTEGRATING: trait_configuration.openness.score * 0.1
-            + trait_configuration.agreeableness.score * 0.2
-            + trait_configuration.conscientiousness.score * 0.1,
-            cls.DOMINATING: trait_configuration.neuroticism.score * -0.2
-            + trait_configuration.extraversion.score * 0.2
-            + trait_configuration.openness.score * -0.2
-            + trait_configuration.agreeableness.score * -0.4
-            + trait_configuration.conscientiousness.score * 0.2,
-            cls.COMPROMISING: trait_configuration.neuroticism.score * 0.1
-            + trait_configuration.extraversion.score * 0.1
-            + trait_configuration.conscientiousness.score * -0.2,
-        }
-
-        # Keep a small chance of selecting counter-indicated styles.
-        minimum_weight = 0.1
-        weights = {
-            style: max(level, minimum_weight)
-            for style, level in style_levels.items()
-        }
-        return _weighted_choice(weights, rng=rng)
+        return _weighted_choice(
+            _style_weights(
+                openness=trait_configuration.openness.score,
+                conscientiousness=trait_configuration.conscientiousness.score,
+                extraversion=trait_configuration.extraversion.score,
+                agreeableness=trait_configuration.agreeableness.score,
+                neuroticism=trait_configuration.neuroticism.score,
+            ),
+            rng=rng,
+        )
+
+
+def _style_weights(
+    *,
+    openness: float,
+    conscientiousness: float,
+    extraversion: float,
+    agreeableness: float,
+    neuroticism: float,
+) -> dict[BigFiveConflictResolutionStyle, float]:
+    # These weights are loosely based on:
+    # Priyadarshini, S. (2017). Effect of Personality on Conflict
+    # Resolution Styles. IRA-International Journal of Management &
+    # Social Sciences, 7(2), 196-207.
+    style_levels = {
+        BigFiveConflictResolutionStyle.AVOIDING: neuroticism * 0.7
+        + openness * -0.1
+        + agreeableness * 0.2
+        + conscientiousness * -0.2,
+        BigFiveConflictResolutionStyle.OBLIGING: neuroticism * 0.2
+        + extraversion * -0.2
+        + openness * -0.1
+        + agreeableness * 0.3,
+        BigFiveConflictResolutionStyle.INTEGRATING: openness * 0.1
+        + agreeableness * 0.2
+        + conscientiousness * 0.1,
+        BigFiveConflictResolutionStyle.DOMINATING: neuroticism * -0.2
+        + extraversion * 0.2
+        + openness * -0.2
+        + agreeableness * -0.4
+        + conscientiousness * 0.2,
+        BigFiveConflictResolutionStyle.COMPROMISING: neuroticism * 0.1
+        + extraversion * 0.1
+        + conscientiousness * -0.2,
+    }
+
+    # Keep a small chance of selecting counter-indicated styles.
+    minimum_weight = 0.1
+    return {
+        style: max(level, minimum_weight)
+        for style, level in style_levels.items()
+    }
 
 
 @dataclass(frozen=True, slots=True)
@@ -115,8 +136,14 @@ class BigFiveTraitConfiguration:
 
     @classmethod
     def random(
-        cls, life_stage: LifeStage, *, rng: RandomSource | None = None
+        cls,
+        life_stage: LifeStage,
+        *,
+        rng: RandomSource | None = None,
+        correlation: CorrelationModel | None = None,
     ) -> Self:
+        if correlation is not None:
+            return correlation.sample_trait_configuration(life_stage, rng=rng)
         return cls(
             openness=BigFiveOpenness.random(life_stage, rng=rng),
             conscientiousness=BigFiveConscientiousness.random(
@@ -214,10 +241,14 @@ class BigFivePersonality:
 
     @classmethod
     def random(
-        cls, life_stage: LifeStage, *, rng: RandomSource | None = None
+        cls,
+        life_stage: LifeStage,
+        *,
+        rng: RandomSource | None = None,
+        correlation: CorrelationModel | None = None,
     ) -> Self:
         trait_configuration = BigFiveTraitConfiguration.random(
-            life_stage, rng=rng
+            life_stage, rng=rng, correlation=correlation
         )
         conflict_configuration = BigFiveConflictResolutionConfiguration.random(
             trait_configuration, rng=rng
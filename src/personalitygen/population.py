@@ -0,0 +1,425 @@
+"""Columnar personality populations for batch generation."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+from personalitygen.enums import LifeStage
+from personalitygen.personality import (
+    BigFiveConflictResolutionConfiguration,
+    BigFiveConflictResolutionStyle,
+    BigFivePersonality,
+    BigFiveTraitConfiguration,
+    _STYLE_TO_CONCERNS,
+    _style_weights,
+    _weighted_choice,
+)
+from personalitygen.randomness import (
+    RandomSource,
+    TruncatedGaussian,
+    _coerce_rng,
+    _random_index,
+)
+from personalitygen.traits import (
+    _AGREEABLENESS_CONFIG,
+    _CONSCIENTIOUSNESS_CONFIG,
+    _EXTRAVERSION_CONFIG,
+    _NEUROTICISM_CONFIG,
+    _OPENNESS_CONFIG,
+    BigFiveAgreeableness,
+    BigFiveConscientiousness,
+    BigFiveExtraversion,
+    BigFiveNeuroticism,
+    BigFiveOpenness,
+    _sampling_plan,
+    _TraitConfig,
+)
+
+if TYPE_CHECKING:
+    from personalitygen.correlation import CorrelationModel
+
+
+@dataclass(frozen=True, slots=True)
+class _TraitSpec:
+    name: str
+    model: type
+    config: _TraitConfig
+    columns: tuple[str, str, str]
+
+
+_TRAIT_SPECS: tuple[_TraitSpec, ...] = (
+    _TraitSpec(
+        name="openness",
+        model=BigFiveOpenness,
+        config=_OPENNESS_CONFIG,
+        columns=(
+            "aesthetic_sensitivity_score",
+            "creative_imagination_score",
+            "intellectual_curiosity_score",
+        ),
+    ),
+    _TraitSpec(
+        name="conscientiousness",
+        model=BigFiveConscientiousness,
+        config=_CONSCIENTIOUSNESS_CONFIG,
+        columns=(
+            "organization_score",
+            "responsibility_score",
+            "productivity_score",
+        ),
+    ),
+    _TraitSpec(
+        name="extraversion",
+        model=BigFiveExtraversion,
+        config=_EXTRAVERSION_CONFIG,
+        columns=(
+            "assertiveness_score",
+            "sociability_score",
+            "energy_level_score",
+        ),
+    ),
+    _TraitSpec(
+        name="agreeableness",
+        model=BigFiveAgreeableness,
+        config=_AGREEABLENESS_CONFIG,
+        columns=(
+            "compassion_score",
+            "respectfulness_score",
+            "trust_score",
+        ),
+    ),
+    _TraitSpec(
+        name="neuroticism",
+        model=BigFiveNeuroticism,
+        config=_NEUROTICISM_CONFIG,
+        columns=(
+            "anxiety_score",
+            "emotional_volatility_score",
+            "depression_score",
+        ),
+    ),
+)
+
+# Trait names mapped to their sub-trait columns, in model field order.
+TRAIT_COLUMNS: dict[str, tuple[str, str, str]] = {
+    spec.name: spec.columns for spec in _TRAIT_SPECS
+}
+
+# Every sub-trait score column, in model field order.
+SCORE_COLUMNS: tuple[str, ...] = tuple(
+    column for spec in _TRAIT_SPECS for column in spec.columns
+)
+
+# Name of the conflict resolution style column in exports and patches.
+STYLE_COLUMN = "conflict_resolution_style"
+
+# Conflict resolution styles are stored as indexes into this tuple.
+CONFLICT_STYLES: tuple[BigFiveConflictResolutionStyle, ...] = tuple(
+    BigFiveConflictResolutionStyle
+)
+
+_STYLE_CODES: dict[BigFiveConflictResolutionStyle, int] = {
+    style: code for code, style in enumerate(CONFLICT_STYLES)
+}
+
+
+def _trait_scores(
+    columns: Mapping[str, Sequence[float]], column_names: Sequence[str]
+) -> Iterator[float]:
+    first, second, third = (columns[name] for name in column_names)
+    return ((a + b + c) / 3 for a, b, c in zip(first, second, third))
+
+
+@dataclass(frozen=True, slots=True)
+class Population:
+    """Personalities stored column by column.
+
+    ``columns`` maps each name in :data:`SCORE_COLUMNS` to its sub-trait
+    scores, and ``styles`` holds one index into :data:`CONFLICT_STYLES` per
+    personality. ``ids`` holds a unique, stable agent ID per personality;
+    when left empty it is filled with ``0..n-1``. Model objects are only
+    built on demand.
+    """
+
+    columns: Mapping[str, Sequence[float]]
+    styles: Sequence[int]
+    ids: Sequence[int] = ()
+
+    def __post_init__(self) -> None:
+        if set(self.columns) != set(SCORE_COLUMNS):
+            missing = sorted(set(SCORE_COLUMNS) - set(self.columns))
+            extra = sorted(set(self.columns) - set(SCORE_COLUMNS))
+            raise ValueError(
+                "Population columns do not match the score columns. "
+                f"Missing: {missing}. Extra: {extra}."
+            )
+        size = len(self.styles)
+        if any(len(values) != size for values in self.columns.values()):
+            raise ValueError("All population columns must have equal length")
+        if len(self.ids) == 0:
+            object.__setattr__(self, "ids", array("Q", range(size)))
+        elif len(self.ids) != size:
+            raise ValueError("Population ids must match the population size")
+
+    def __len__(self) -> int:
+        return len(self.styles)
+
+    def __iter__(self) -> Iterator[BigFivePersonality]:
+        for index in range(len(self)):
+            yield self.personality(index)
+
+    @classmethod
+    def from_personalities(
+        cls, personalities: Iterable[BigFivePersonality]
+    ) -> Self:
+        columns = {column: array("d") for column in SCORE_COLUMNS}
+        styles = array("B")
+        for personality in personalities:
+            traits = personality.trait_configuration
+            for spec in _TRAIT_SPECS:
+                trait = getattr(traits, spec.name)
+                for column in spec.columns:
+                    columns[column].append(getattr(trait, column))
+            conflict = personality.conflict_resolution_configuration
+            styles.append(_STYLE_CODES[conflict.conflict_resolution_style])
+        return cls(columns=columns, styles=styles)
+
+    def trait_scores(self, trait: str) -> list[float]:
+        """Return the aggregate score of ``trait`` for every personality."""
+        column_names = TRAIT_COLUMNS.get(trait)
+        if column_names is None:
+            raise ValueError(f"Unknown trait: {trait}")
+        return list(_trait_scores(self.columns, column_names))
+
+    def conflict_style(self, index: int) -> BigFiveConflictResolutionStyle:
+        return CONFLICT_STYLES[self.styles[index]]
+
+    def rows(self) -> Iterator[tuple[float, ...]]:
+        """Yield each personality's scores in :data:`SCORE_COLUMNS` order."""
+        return zip(*(self.columns[column] for column in SCORE_COLUMNS))
+
+    def personality(self, index: int) -> BigFivePersonality:
+        """Build the model view of the personality at ``index``."""
+        traits = {
+            spec.name: spec.model(
+                **{
+                    column: self.columns[column][index]
+                    for column in spec.columns
+                }
+            )
+            for spec in _TRAIT_SPECS
+        }
+        style = self.conflict_style(index)
+        concern_for_self, concern_for_others = _STYLE_TO_CONCERNS[style]
+        return BigFivePersonality(
+            trait_configuration=BigFiveTraitConfiguration(**traits),
+            conflict_resolution_configuration=(
+                BigFiveConflictResolutionConfiguration(
+                    conflict_resolution_style=style,
+                    concern_for_self=concern_for_self,
+                    concern_for_others=concern_for_others,
+                )
+            ),
+        )
+
+
+def _column_samplers(life_stage: LifeStage) -> list[TruncatedGaussian]:
+    """Return one sampler per entry of :data:`SCORE_COLUMNS`."""
+    return [
+        sampler
+        for spec in _TRAIT_SPECS
+        for sampler in _sampling_plan(spec.config, life_stage).samplers
+    ]
+
+
+def _sample_styles(
+    columns: Mapping[str, Sequence[float]], source: RandomSource
+) -> array:
+    openness, conscientiousness, extraversion, agreeableness, neuroticism = (
+        _trait_scores(columns, spec.columns) for spec in _TRAIT_SPECS
+    )
+    return array(
+        "B",
+        (
+            _STYLE_CODES[
+                _weighted_choice(
+                    _style_weights(
+                        openness=o,
+                        conscientiousness=c,
+                        extraversion=e,
+                        agreeableness=a,
+                        neuroticism=n,
+                    ),
+                    rng=source,
+                )
+            ]
+            for o, c, e, a, n in zip(
+                openness,
+                conscientiousness,
+                extraversion,
+                agreeableness,
+                neuroticism,
+            )
+        ),
+    )
+
+
+def _validate_mix(mix: Mapping[LifeStage, float]) -> float:
+    if not mix:
+        raise ValueError("mix must be non-empty")
+    if not all(
+        math.isfinite(weight) and weight >= 0.0 for weight in mix.values()
+    ):
+        raise ValueError("mix weights must be finite and non-negative")
+    total = sum(mix.values())
+    if total <= 0.0:
+        raise ValueError("mix weights must not all be zero")
+    return total
+
+
+def _stage_counts(
+    count: int,
+    mix: Mapping[LifeStage, float],
+    assigned: Mapping[LifeStage, int] | None = None,
+) -> dict[LifeStage, int]:
+    """Split the next ``count`` agents between the stages of ``mix``.
+
+    ``assigned`` holds the stage counts of earlier agents, so that the
+    running totals keep following the weights when a large population is
+    generated in pieces. Each stage gets the whole part of its shortfall
+    against its quota, and the rest goes by largest remainder.
+    """
+    total = _validate_mix(mix)
+    assigned = assigned if assigned is not None else {}
+    size = count + sum(assigned.values())
+    shortfalls = {
+        stage: size * weight / total - assigned.get(stage, 0)
+        for stage, weight in mix.items()
+    }
+    counts = {
+        stage: max(math.floor(shortfall), 0)
+        for stage, shortfall in shortfalls.items()
+    }
+    remaining = count - sum(counts.values())
+    by_remainder = sorted(
+        shortfalls,
+        key=lambda stage: shortfalls[stage] - counts[stage],
+        reverse=True,
+    )
+    if remaining >= 0:
+        for stage in by_remainder[:remaining]:
+            counts[stage] += 1
+    else:
+        # Stages that were behind can claim more than the piece holds;
+        # take the excess back from the ones furthest ahead of quota.
+        ahead = by_remainder[::-1]
+        position = 0
+        while remaining:
+            stage = ahead[position % len(ahead)]
+            position += 1
+            if counts[stage]:
+                counts[stage] -= 1
+                remaining += 1
+    return counts
+
+
+def sample_life_stages(
+    count: int,
+    mix: Mapping[LifeStage, float],
+    *,
+    rng: RandomSource | None = None,
+) -> list[LifeStage]:
+    """Assign ``count`` life stages in the proportions of ``mix``.
+
+    Stage counts follow the weights exactly (largest remainder rounding),
+    and the stages are then shuffled so they are spread through the result.
+    """
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    counts = _stage_counts(count, mix)
+
+    stages = [stage for stage, size in counts.items() for _ in range(size)]
+    source = _coerce_rng(rng)
+    for index in range(len(stages) - 1, 0, -1):
+        other = _random_index(source, index + 1)
+        stages[index], stages[other] = stages[other], stages[index]
+    return stages
+
+
+def _sample_mixed_columns(
+    life_stages: Sequence[LifeStage], source: RandomSource
+) -> dict[str, array]:
+    present = list(dict.fromkeys(life_stages))
+    stage_codes = {stage: code for code, stage in enumerate(present)}
+    codes = [stage_codes[stage] for stage in life_stages]
+    samplers_by_stage = [_column_samplers(stage) for stage in present]
+
+    columns: dict[str, array] = {}
+    for position, column in enumerate(SCORE_COLUMNS):
+        # One lookup per column and stage; agents only index this tuple.
+        draws = tuple(
+            samplers[position].sample for samplers in samplers_by_stage
+        )
+        columns[column] = array("d", [draws[code](source) for code in codes])
+    return columns
+
+
+def generate_population(
+    count: int,
+    life_stage: LifeStage | Sequence[LifeStage] | Mapping[LifeStage, float],
+    *,
+    rng: RandomSource | None = None,
+    correlation: CorrelationModel | None = None,
+    first_id: int = 0,
+) -> Population:
+    """Generate ``count`` personalities column by column.
+
+    Each sub-trait column is drawn in one batch from a sampler that is set
+    up once, so the result follows the same distributions as
+    :meth:`BigFivePersonality.random` without building model objects. The
+    draw order differs, so a seeded source yields a different (but equally
+    reproducible) population than repeated ``random`` calls. With
+    ``correlation`` the score columns come from the correlation model's
+    batch sampler instead. Agent IDs are assigned consecutively from
+    ``first_id``.
+
+    ``life_stage`` is either one stage for everyone, a per-agent sequence
+    of ``count`` stages (output keeps its order), or a mapping of stage
+    weights that is expanded with :func:`sample_life_stages`.
+    """
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    if first_id < 0:
+        raise ValueError("first_id must be non-negative")
+    source = _coerce_rng(rng)
+
+    life_stages: LifeStage | Sequence[LifeStage]
+    if isinstance(life_stage, LifeStage):
+        life_stages = life_stage
+    elif isinstance(life_stage, Mapping):
+        life_stages = sample_life_stages(count, life_stage, rng=source)
+    else:
+        if len(life_stage) != count:
+            raise ValueError("life_stage must have one entry per agent")
+        life_stages = life_stage
+
+    if correlation is not None:
+        columns = correlation.sample_columns(count, life_stages, rng=source)
+    elif isinstance(life_stages, LifeStage):
+        columns = {
+            column: array("d", sampler.sample_batch(count, source))
+            for column, sampler in zip(
+                SCORE_COLUMNS, _column_samplers(life_stages)
+            )
+        }
+    else:
+        columns = _sample_mixed_columns(life_stages, source)
+    return Population(
+        columns=columns,
+        styles=_sample_styles(columns, source),
+        ids=array("Q", range(first_id, first_id + count)),
+    )
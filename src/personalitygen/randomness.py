@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import random
-import statistics
 from typing import Protocol
 
 
@@ -16,7 +14,107 @@ class RandomSource(Protocol):
 
 
 def _coerce_rng(rng: RandomSource | None) -> RandomSource:
-    return rng if rng is not None else random
+    if rng is not None:
+        return rng
+    # Deferred so that importing the models does not pay for ``random``.
+    import random
+
+    return random
+
+
+def _random_index(source: RandomSource, upper: int) -> int:
+    # ``randrange`` is not part of RandomSource, so fall back to uniform.
+    randrange = getattr(source, "randrange", None)
+    if randrange is not None:
+        return randrange(upper)
+    return min(int(source.uniform(0.0, upper)), upper - 1)
+
+
+class TruncatedGaussian:
+    """Truncated Gaussian whose bounds are resolved once for repeated draws."""
+
+    __slots__ = (
+        "mean",
+        "stddev",
+        "min_value",
+        "max_value",
+        "_inv_cdf",
+        "_lower",
+        "_upper",
+        "_fixed_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        mean: float,
+        stddev: float,
+        min_value: float,
+        max_value: float,
+    ) -> None:
+        if stddev <= 0:
+            raise ValueError("stddev must be positive")
+        if min_value > max_value:
+            raise ValueError("min_value must be <= max_value")
+        self.mean = mean
+        self.stddev = stddev
+        self.min_value = min_value
+        self.max_value = max_value
+
+        # Deferred so that importing the models does not pay for
+        # ``statistics``.
+        from statistics import NormalDist
+
+        distribution = NormalDist(mean, stddev)
+        self._inv_cdf = distribution.inv_cdf
+        self._lower = distribution.cdf(min_value)
+        self._upper = distribution.cdf(max_value)
+        self._fixed_value: float | None = None
+        if self._lower >= self._upper:
+            self._fixed_value = max(min_value, min(max_value, mean))
+            return
+
+        cdf_epsilon = 1e-12
+        self._lower = max(self._lower, cdf_epsilon)
+        self._upper = min(self._upper, 1.0 - cdf_epsilon)
+        if self._lower >= self._upper:
+            self._fixed_value = max(min_value, min(max_value, mean))
+
+    @property
+    def probability_range(self) -> tuple[float, float] | None:
+        """CDF range samples are drawn from, or ``None`` for a fixed value."""
+        if self._fixed_value is not None:
+            return None
+        return self._lower, self._upper
+
+    def sample(self, rng: RandomSource | None = None) -> float:
+        """Draw a single sample."""
+        if self._fixed_value is not None:
+            return self._fixed_value
+        source = _coerce_rng(rng)
+        return self._inv_cdf(source.uniform(self._lower, self._upper))
+
+    def quantile(self, probability: float) -> float:
+        """Map ``probability`` in 0.0...1.0 onto the truncated distribution."""
+        if self._fixed_value is not None:
+            return self._fixed_value
+        return self._inv_cdf(
+            self._lower + (self._upper - self._lower) * probability
+        )
+
+    def sample_batch(
+        self, count: int, rng: RandomSource | None = None
+    ) -> list[float]:
+        """Draw ``count`` samples, matching repeated :meth:`sample` calls."""
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        if self._fixed_value is not None:
+            return [self._fixed_value] * count
+        uniform = _coerce_rng(rng).uniform
+        inv_cdf = self._inv_cdf
+        lower = self._lower
+        upper = self._upper
+        return [inv_cdf(uniform(lower, upper)) for _ in range(count)]
 
 
 def random_gaussian(
@@ -28,23 +126,9 @@ def random_gaussian(
     rng: RandomSource | None = None,
 ) -> float:
     """Draw a truncated Gaussian sample within the provided bounds."""
-    if stddev <= 0:
-        raise ValueError("stddev must be positive")
-    if min_value > max_value:
-        raise ValueError("min_value must be <= max_value")
-
-    source = _coerce_rng(rng)
-    distribution = statistics.NormalDist(mean, stddev)
-    lower = distribution.cdf(min_value)
-    upper = distribution.cdf(max_value)
-    if lower >= upper:
-        return max(min_value, min(max_value, mean))
-
-    cdf_epsilon = 1e-12
-    lower = max(lower, cdf_epsilon)
-    upper = min(upper, 1.0 - cdf_epsilon)
-    if lower >= upper:
-        return max(min_value, min(max_value, mean))
-
-    u = source.uniform(lower, upper)
-    return distribution.inv_cdf(u)
+    return TruncatedGaussian(
+        mean=mean,
+        stddev=stddev,
+        min_value=min_value,
+        max_value=max_value,
+    ).sample(rng)
@@ -0,0 +1,162 @@
+"""Share a columnar population between processes without copying it.
+
+The shared block starts with a 16-byte header (``PGSM`` magic, ``uint16``
+version, two padding bytes, ``uint64`` row count), followed by the fifteen
+``float64`` score columns in ``SCORE_COLUMNS`` order, the ``uint64`` agent
+IDs and the ``uint8`` style codes. Blocks never leave the host, so
+everything uses native byte order.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Self
+
+from personalitygen.personality import BigFivePersonality
+from personalitygen.population import SCORE_COLUMNS, Population
+
+SHARED_MAGIC = b"PGSM"
+SHARED_VERSION = 1
+_HEADER = struct.Struct("=4sH2xQ")
+
+
+def _as_bytes(
+    values: Sequence[float] | Sequence[int], typecode: str
+) -> memoryview:
+    if not (isinstance(values, array) and values.typecode == typecode):
+        values = array(typecode, values)
+    return memoryview(values).cast("B")
+
+
+def _open_existing(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching always registers with the resource tracker.
+    # Worker processes started by the publisher share its tracker, so the
+    # block is still only cleaned up when the whole process tree is done.
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedPopulation:
+    """A population stored in ``multiprocessing.shared_memory``.
+
+    :meth:`publish` copies a population into a new shared block once; any
+    process can then :meth:`attach` to it by name. Every handle exposes the
+    block as a read-only :class:`Population` whose columns are memoryviews
+    into shared memory, so attaching copies nothing and model objects are
+    only built on demand. Pickling a handle sends just the block name.
+
+    Call :meth:`close` in every process when done (dropping any column
+    views first), and :meth:`unlink` once in the publisher. On Python
+    versions before 3.13, attach only from processes started by the
+    publisher; an unrelated process would unlink the block when it exits.
+    """
+
+    def __init__(
+        self, block: shared_memory.SharedMemory, *, owner: bool
+    ) -> None:
+        self._block = block
+        self._owner = owner
+        self._views: list[memoryview] = []
+        try:
+            self.population = self._map_population()
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def publish(
+        cls, population: Population, *, name: str | None = None
+    ) -> Self:
+        size = len(population)
+        total = _HEADER.size + size * (8 * len(SCORE_COLUMNS) + 8 + 1)
+        block = shared_memory.SharedMemory(
+            name=name, create=True, size=max(total, 1)
+        )
+        try:
+            buffer = block.buf
+            _HEADER.pack_into(buffer, 0, SHARED_MAGIC, SHARED_VERSION, size)
+            offset = _HEADER.size
+            sections = [
+                (population.columns[column], "d") for column in SCORE_COLUMNS
+            ]
+            sections += [(population.ids, "Q"), (population.styles, "B")]
+            for values, typecode in sections:
+                data = _as_bytes(values, typecode)
+                buffer[offset:offset + len(data)] = data
+                offset += len(data)
+            return cls(block, owner=True)
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        return cls(_open_existing(name), owner=False)
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return type(self).attach, (self.name,)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __len__(self) -> int:
+        return len(self.population)
+
+    @property
+    def name(self) -> str:
+        return self._block.name
+
+    def personality(self, index: int) -> BigFivePersonality:
+        return self.population.personality(index)
+
+    def _view(self, start: int, count: int, typecode: str) -> memoryview:
+        size = struct.calcsize(typecode)
+        view = (
+            self._block.buf[start:start + count * size]
+            .cast(typecode)
+            .toreadonly()
+        )
+        self._views.append(view)
+        return view
+
+    def _map_population(self) -> Population:
+        magic, version, size = _HEADER.unpack_from(self._block.buf, 0)
+        if magic != SHARED_MAGIC or version != SHARED_VERSION:
+            raise ValueError(
+                f"Shared block {self._block.name!r} does not hold a "
+                "personalitygen population"
+            )
+
+        offset = _HEADER.size
+        columns = {}
+        for column in SCORE_COLUMNS:
+            columns[column] = self._view(offset, size, "d")
+            offset += size * 8
+        ids = self._view(offset, size, "Q")
+        offset += size * 8
+        styles = self._view(offset, size, "B")
+        return Population(columns=columns, styles=styles, ids=ids)
+
+    def close(self) -> None:
+        """Release the views and detach this handle from the block."""
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Destroy the block; only the publishing handle may do this."""
+        if not self._owner:
+            raise ValueError("Only the publishing handle can unlink")
+        self._block.unlink()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Self
 
 from personalitygen.constants import UNIT_RANGE_MAX, UNIT_RANGE_MIN
 from personalitygen.enums import LifeStage
-from personalitygen.randomness import RandomSource, random_gaussian
+from personalitygen.randomness import (
+    RandomSource,
+    TruncatedGaussian,
+    _coerce_rng,
+)
 
 
 def _validate_unit_range(*values: float) -> None:
@@ -25,46 +30,94 @@ def _format_score(value: float) -> str:
 _TRAIT_SAMPLE_MIN = 0.01
 
 
-@dataclass(frozen=True, slots=True)
+# Compared by identity so configs can key the sampling plan cache even
+# though ``means_by_stage`` is a dict.
+@dataclass(frozen=True, slots=True, eq=False)
 class _TraitConfig:
     stddev: float
     means_by_stage: dict[LifeStage, tuple[float, float, float]]
 
 
-def _sample_trait(
-    life_stage: LifeStage,
+@dataclass(frozen=True, slots=True)
+class _SamplingPlan:
+    samplers: tuple[TruncatedGaussian, TruncatedGaussian, TruncatedGaussian]
+
+    def sample(
+        self, rng: RandomSource | None = None
+    ) -> tuple[float, float, float]:
+        source = _coerce_rng(rng)
+        first, second, third = self.samplers
+        return (
+            first.sample(source),
+            second.sample(source),
+            third.sample(source),
+        )
+
+
+_PlanKey = tuple[_TraitConfig, LifeStage, float, float]
+
+# Plans for the built-in configs are kept for the life of the process;
+# plans for any other config live in a bounded LRU cache.
+_BUILTIN_PLANS: dict[_PlanKey, _SamplingPlan] = {}
+_CUSTOM_PLANS: OrderedDict[_PlanKey, _SamplingPlan] = OrderedDict()
+_CUSTOM_PLANS_MAXSIZE = 128
+_BUILTIN_CONFIGS: set[_TraitConfig] = set()
+
+
+def _sampling_plan(
     config: _TraitConfig,
+    life_stage: LifeStage,
     *,
-    rng: RandomSource | None = None,
-) -> tuple[float, float, float]:
+    min_value: float = _TRAIT_SAMPLE_MIN,
+    max_value: float = UNIT_RANGE_MAX,
+) -> _SamplingPlan:
+    key = (config, life_stage, min_value, max_value)
+    plan = _BUILTIN_PLANS.get(key)
+    if plan is not None:
+        return plan
+    plan = _CUSTOM_PLANS.get(key)
+    if plan is not None:
+        _CUSTOM_PLANS.move_to_end(key)
+        return plan
+
     means = config.means_by_stage.get(life_stage)
     if means is None:
         raise ValueError(f"Unsupported life stage: {life_stage}")
 
-    mean_a, mean_b, mean_c = means
-    return (
-        random_gaussian(
-            stddev=config.stddev,
-            mean=mean_a,
-            max_value=UNIT_RANGE_MAX,
-            min_value=_TRAIT_SAMPLE_MIN,
-            rng=rng,
-        ),
-        random_gaussian(
+    def sampler(mean: float) -> TruncatedGaussian:
+        return TruncatedGaussian(
+            mean=mean,
             stddev=config.stddev,
-            mean=mean_b,
-            max_value=UNIT_RANGE_MAX,
-            min_value=_TRAIT_SAMPLE_MIN,
-            rng=rng,
-        ),
-        random_gaussian(
-            stddev=config.stddev,
-            mean=mean_c,
-            max_value=UNIT_RANGE_MAX,
-            min_value=_TRAIT_SAMPLE_MIN,
-            rng=rng,
-        ),
+            min_value=min_value,
+            max_value=max_value,
+        )
+
+    mean_a, mean_b, mean_c = means
+    plan = _SamplingPlan(
+        samplers=(sampler(mean_a), sampler(mean_b), sampler(mean_c))
     )
+    if config in _BUILTIN_CONFIGS:
+        _BUILTIN_PLANS[key] = plan
+    else:
+        _CUSTOM_PLANS[key] = plan
+        if len(_CUSTOM_PLANS) > _CUSTOM_PLANS_MAXSIZE:
+            _CUSTOM_PLANS.popitem(last=False)
+    return plan
+
+
+def _clear_sampling_plans() -> None:
+    """Drop every cached plan, e.g. after a config's means were changed."""
+    _BUILTIN_PLANS.clear()
+    _CUSTOM_PLANS.clear()
+
+
+def _sample_trait(
+    life_stage: LifeStage,
+    config: _TraitConfig,
+    *,
+    rng: RandomSource | None = None,
+) -> tuple[float, float, float]:
+    return _sampling_plan(config, life_stage).sample(rng)
 
 
 _OPENNESS_CONFIG = _TraitConfig(
@@ -112,6 +165,16 @@ _NEUROTICISM_CONFIG = _TraitConfig(
     },
 )
 
+_BUILTIN_CONFIGS.update(
+    (
+        _OPENNESS_CONFIG,
+        _CONSCIENTIOUSNESS_CONFIG,
+        _EXTRAVERSION_CONFIG,
+        _AGREEABLENESS_CONFIG,
+        _NEUROTICISM_CONFIG,
+    )
+)
+
 
 @dataclass(frozen=True, slots=True)
 class BigFiveOpenness:
@@ -0,0 +1,108 @@
+import json
+import struct
+from pathlib import Path
+
+import pytest
+
+from personalitygen.cli import BINARY_MAGIC, _chunk_tasks, main
+from personalitygen.enums import LifeStage
+from personalitygen.population import SCORE_COLUMNS
+
+
+def test_jsonl_output_is_reproducible(tmp_path: Path) -> None:
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+
+    main(["-n", "25", "--seed", "3", "--chunk-size", "10", "-o", str(first)])
+    main(["-n", "25", "--seed", "3", "--chunk-size", "10", "-o", str(second)])
+
+    lines = first.read_text().splitlines()
+    assert len(lines) == 25
+    assert first.read_bytes() == second.read_bytes()
+    record = json.loads(lines[0])
+    assert set(record) == {*SCORE_COLUMNS, "conflict_resolution_style"}
+
+
+def test_workers_do_not_change_seeded_output(tmp_path: Path) -> None:
+    serial = tmp_path / "serial.csv"
+    parallel = tmp_path / "parallel.csv"
+    arguments = [
+        "-n", "30", "--seed", "9", "--chunk-size", "7", "--format", "csv"
+    ]
+
+    main([*arguments, "-o", str(serial)])
+    main([*arguments, "--workers", "2", "-o", str(parallel)])
+
+    assert serial.read_bytes() == parallel.read_bytes()
+    assert len(serial.read_text().splitlines()) == 31
+
+
+def test_binary_output_layout(tmp_path: Path) -> None:
+    output = tmp_path / "out.bin"
+
+    main(["-n", "4", "--seed", "1", "--format", "binary", "-o", str(output)])
+
+    data = output.read_bytes()
+    magic, version, count = struct.unpack_from("<4sHQ", data)
+    record_size = struct.calcsize(f"<{len(SCORE_COLUMNS)}dB")
+    assert (magic, version, count) == (BINARY_MAGIC, 1, 4)
+    assert len(data) == struct.calcsize("<4sHQ") + 4 * record_size
+
+
+def test_stats_summary_goes_to_stderr(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    output = tmp_path / "out.jsonl"
+
+    main(["-n", "10", "--seed", "2", "--stats", "-o", str(output)])
+
+    summary = capsys.readouterr().err
+    assert "count: 10" in summary
+    assert "agreeableness: mean=" in summary
+
+
+def test_stage_mix_option(tmp_path: Path) -> None:
+    output = tmp_path / "mixed.jsonl"
+
+    main(["-n", "12", "--stage-mix", "child=1,adult=2", "-o", str(output)])
+
+    assert len(output.read_text().splitlines()) == 12
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_stage_mix_is_split_across_chunks(chunk_size: int) -> None:
+    mix = {LifeStage.CHILD: 20, LifeStage.YOUNG_ADULT: 30, LifeStage.ADULT: 50}
+    totals = dict.fromkeys(mix, 0)
+
+    for _, _, size, counts, _ in _chunk_tasks(1000, chunk_size, mix, None):
+        assert sum(counts.values()) == size
+        for stage, count in counts.items():
+            totals[stage] += count
+
+    assert totals == {
+        LifeStage.CHILD: 200,
+        LifeStage.YOUNG_ADULT: 300,
+        LifeStage.ADULT: 500,
+    }
+
+
+@pytest.mark.parametrize(
+    "mix",
+    [
+        "child=-1,adult=2",
+        "child=nan",
+        "adult=inf",
+        "child=0,adult=0",
+        "child=1,child=0",
+        "child",
+    ],
+)
+def test_invalid_stage_mix_is_rejected_before_output(
+    tmp_path: Path, mix: str
+) -> None:
+    output = tmp_path / "never.jsonl"
+
+    with pytest.raises(SystemExit):
+        main(["-n", "5", "--stage-mix", mix, "-o", str(output)])
+
+    assert not output.exists()
@@ -0,0 +1,123 @@
+import random
+import statistics
+
+import pytest
+
+from personalitygen.correlation import CorrelationModel
+from personalitygen.enums import LifeStage
+from personalitygen.personality import (
+    BigFivePersonality,
+    BigFiveTraitConfiguration,
+)
+from personalitygen.population import SCORE_COLUMNS, generate_population
+
+# Openness and agreeableness correlate positively, openness and neuroticism
+# negatively; every other trait pair is independent.
+TRAIT_MATRIX = [
+    [1.0, 0.0, 0.0, 0.6, -0.5],
+    [0.0, 1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0, 0.0],
+    [0.6, 0.0, 0.0, 1.0, 0.0],
+    [-0.5, 0.0, 0.0, 0.0, 1.0],
+]
+
+
+def _identity(size: int) -> list[list[float]]:
+    return [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_correlated_population_follows_matrix(vectorized: bool) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
+    model = CorrelationModel(
+        {LifeStage.ADULT: TRAIT_MATRIX}, vectorized=vectorized
+    )
+
+    population = generate_population(
+        4_000, LifeStage.ADULT, rng=random.Random(12), correlation=model
+    )
+
+    openness = population.trait_scores("openness")
+    agreeableness = population.trait_scores("agreeableness")
+    neuroticism = population.trait_scores("neuroticism")
+    extraversion = population.trait_scores("extraversion")
+    assert statistics.correlation(openness, agreeableness) > 0.25
+    assert statistics.correlation(openness, neuroticism) < -0.2
+    assert abs(statistics.correlation(openness, extraversion)) < 0.1
+    for column in SCORE_COLUMNS:
+        values = population.columns[column]
+        assert all(0.01 <= value <= 1.0 for value in values)
+
+
+def test_identity_matrix_keeps_marginal_means() -> None:
+    model = CorrelationModel({LifeStage.CHILD: _identity(15)})
+    correlated = generate_population(
+        3_000, LifeStage.CHILD, rng=random.Random(1), correlation=model
+    )
+    independent = generate_population(
+        3_000, LifeStage.CHILD, rng=random.Random(1)
+    )
+
+    for trait in ("openness", "neuroticism"):
+        assert statistics.fmean(correlated.trait_scores(trait)) == (
+            pytest.approx(
+                statistics.fmean(independent.trait_scores(trait)), abs=0.02
+            )
+        )
+
+
+def test_correlated_models_are_deterministic_for_seed() -> None:
+    model = CorrelationModel({LifeStage.YOUNG_ADULT: TRAIT_MATRIX})
+
+    first = BigFivePersonality.random(
+        LifeStage.YOUNG_ADULT, rng=random.Random(4), correlation=model
+    )
+    second = BigFivePersonality.random(
+        LifeStage.YOUNG_ADULT, rng=random.Random(4), correlation=model
+    )
+
+    assert first == second
+
+
+def test_missing_life_stage_is_rejected() -> None:
+    model = CorrelationModel({LifeStage.ADULT: TRAIT_MATRIX})
+
+    with pytest.raises(ValueError, match="No correlation matrix"):
+        BigFiveTraitConfiguration.random(LifeStage.CHILD, correlation=model)
+
+
+def test_invalid_matrices_are_rejected() -> None:
+    not_definite = [row[:] for row in _identity(5)]
+    not_definite[0][1] = not_definite[1][0] = 1.0
+    not_definite[0][2] = not_definite[2][0] = -1.0
+    not_definite[1][2] = not_definite[2][1] = 1.0
+    asymmetric = [row[:] for row in _identity(5)]
+    asymmetric[0][1] = 0.3
+
+    with pytest.raises(ValueError, match="5x5 or 15x15"):
+        CorrelationModel({LifeStage.ADULT: _identity(4)})
+    with pytest.raises(ValueError, match="symmetric"):
+        CorrelationModel({LifeStage.ADULT: asymmetric})
+    with pytest.raises(ValueError, match="positive definite"):
+        CorrelationModel(
+            {LifeStage.ADULT: not_definite}, facet_correlation=0.9
+        )
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_correlated_mixed_stages(vectorized: bool) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
+    model = CorrelationModel(
+        {LifeStage.CHILD: TRAIT_MATRIX, LifeStage.ADULT: TRAIT_MATRIX},
+        vectorized=vectorized,
+    )
+    stages = [LifeStage.CHILD, LifeStage.ADULT] * 1_000
+
+    population = generate_population(
+        len(stages), stages, rng=random.Random(5), correlation=model
+    )
+
+    openness = population.trait_scores("openness")
+    assert statistics.fmean(openness[0::2]) > statistics.fmean(openness[1::2])
@@ -0,0 +1,198 @@
+import random
+from array import array
+
+import pytest
+
+from personalitygen.diffing import (
+    ColumnPatch,
+    PopulationPatch,
+    apply_patch,
+    diff_populations,
+)
+from personalitygen.enums import LifeStage
+from personalitygen.population import (
+    SCORE_COLUMNS,
+    STYLE_COLUMN,
+    Population,
+    generate_population,
+)
+
+
+def _copy(population: Population) -> dict[str, array]:
+    return {
+        column: array("d", values)
+        for column, values in population.columns.items()
+    }
+
+
+def test_identical_snapshots_produce_empty_patch() -> None:
+    population = generate_population(
+        100, LifeStage.ADULT, rng=random.Random(1)
+    )
+
+    patch = diff_populations(population, population)
+
+    assert patch.is_empty
+    assert apply_patch(population, patch) == population
+
+
+def test_patch_carries_only_changed_cells() -> None:
+    old = generate_population(200, LifeStage.ADULT, rng=random.Random(2))
+    columns = _copy(old)
+    columns["trust_score"][7] = 0.9
+    columns["anxiety_score"][150] = 0.1
+    styles = array("B", old.styles)
+    styles[3] = (styles[3] + 1) % 5
+    new = Population(columns=columns, styles=styles, ids=old.ids)
+
+    patch = diff_populations(old, new)
+
+    assert patch.changed_cells == 3
+    assert {change.column for change in patch.changes} == {
+        "trust_score",
+        "anxiety_score",
+        STYLE_COLUMN,
+    }
+    assert apply_patch(old, patch) == new
+
+
+def test_per_column_tolerance_suppresses_small_moves() -> None:
+    old = generate_population(50, LifeStage.CHILD, rng=random.Random(3))
+    columns = _copy(old)
+    columns["trust_score"][0] += 0.001
+    columns["sociability_score"][1] += 0.001
+    new = Population(columns=columns, styles=old.styles, ids=old.ids)
+
+    patch = diff_populations(old, new, tolerance={"trust_score": 0.01})
+
+    assert [change.column for change in patch.changes] == [
+        "sociability_score"
+    ]
+
+
+def test_membership_changes_are_matched_by_id() -> None:
+    old = generate_population(10, LifeStage.ADULT, rng=random.Random(4))
+    joined = generate_population(
+        2, LifeStage.ADULT, rng=random.Random(5), first_id=100
+    )
+    keep = [position for position in range(10) if position not in (2, 5)]
+    columns = {
+        column: array(
+            "d",
+            [old.columns[column][position] for position in keep]
+            + list(joined.columns[column]),
+        )
+        for column in SCORE_COLUMNS
+    }
+    columns["organization_score"][0] = 0.5
+    new = Population(
+        columns=columns,
+        styles=array(
+            "B", [old.styles[position] for position in keep] + [*joined.styles]
+        ),
+        ids=array("Q", [old.ids[position] for position in keep] + [100, 101]),
+    )
+
+    patch = diff_populations(old, new)
+
+    assert list(patch.removed_ids) == [2, 5]
+    assert patch.added is not None
+    assert list(patch.added.ids) == [100, 101]
+    assert patch.changed_cells == 1
+    assert apply_patch(old, patch) == new
+
+
+def test_diff_rejects_unknown_tolerance_columns() -> None:
+    population = generate_population(1, LifeStage.ADULT)
+
+    with pytest.raises(ValueError, match="Unknown score columns"):
+        diff_populations(population, population, tolerance={"charm": 0.1})
+
+
+def test_diff_rejects_duplicate_agent_ids() -> None:
+    old = generate_population(5, LifeStage.ADULT, rng=random.Random(4))
+    new = Population(
+        columns=_copy(old), styles=old.styles, ids=array("Q", [7] * 5)
+    )
+
+    with pytest.raises(ValueError, match="duplicate agent IDs"):
+        diff_populations(old, new)
+    with pytest.raises(ValueError, match="duplicate agent IDs"):
+        diff_populations(new, old)
+
+
+def test_apply_rejects_added_ids_already_present() -> None:
+    base = generate_population(3, LifeStage.ADULT)
+    patch = diff_populations(
+        generate_population(0, LifeStage.ADULT), base
+    )
+
+    with pytest.raises(ValueError, match="already present"):
+        apply_patch(base, patch)
+
+
+@pytest.mark.parametrize("reorder", [False, True])
+def test_vectorized_diff_and_apply_match_pure_python(reorder: bool) -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(6)
+    old = generate_population(300, LifeStage.ADULT, rng=rng)
+    columns = _copy(old)
+    for values in columns.values():
+        for index in rng.sample(range(300), 40):
+            values[index] = rng.random()
+    styles = array("B", old.styles)
+    styles[10] = (styles[10] + 2) % 5
+    ids = array("Q", old.ids)
+    if reorder:
+        # Drop the first agent and add a newcomer to force ID matching.
+        ids[0] = 1_000
+    new = Population(columns=columns, styles=styles, ids=ids)
+
+    for tolerance in (0.0, 0.05):
+        expected = diff_populations(old, new, tolerance=tolerance)
+        patch = diff_populations(
+            old, new, tolerance=tolerance, vectorized=True
+        )
+
+        assert patch == expected
+        assert apply_patch(old, patch, vectorized=True) == apply_patch(
+            old, patch
+        )
+
+    exact = diff_populations(old, new, vectorized=True)
+    rebuilt = apply_patch(old, exact, vectorized=True)
+    assert sorted(zip(rebuilt.ids, rebuilt.rows())) == sorted(
+        zip(new.ids, new.rows())
+    )
+
+
+def test_apply_rejects_negative_patch_indices() -> None:
+    base = generate_population(3, LifeStage.ADULT)
+    patch = PopulationPatch(
+        changes=(ColumnPatch("trust_score", [-1], [0.5]),), removed_ids=()
+    )
+
+    with pytest.raises(ValueError, match="outside the population"):
+        apply_patch(base, patch)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_numpy_backed_populations_can_be_diffed(vectorized: bool) -> None:
+    np = pytest.importorskip("numpy")
+    old = generate_population(20, LifeStage.ADULT, rng=random.Random(7))
+    columns = {
+        column: np.array(values) for column, values in old.columns.items()
+    }
+    columns["trust_score"][4] = 0.25
+    new = Population(columns=columns, styles=np.array(old.styles))
+    assert list(new.ids) == list(range(20))
+    numpy_ids = Population(
+        columns=columns,
+        styles=np.array(old.styles),
+        ids=np.arange(20, dtype=np.uint64),
+    )
+
+    for snapshot in (new, numpy_ids):
+        patch = diff_populations(old, snapshot, vectorized=vectorized)
+        assert patch.changed_cells == 1
+        assert not patch.is_empty
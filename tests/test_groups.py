@@ -0,0 +1,131 @@
+import random
+
+import pytest
+
+from personalitygen.enums import LifeStage, PriorityLevel
+from personalitygen.groups import (
+    Bounds,
+    GroupConstraints,
+    GroupObjective,
+    select_groups,
+)
+from personalitygen.personality import BigFiveConflictResolutionStyle
+from personalitygen.population import generate_population
+
+
+def test_select_groups_meets_constraints() -> None:
+    population = generate_population(
+        2_000, LifeStage.ADULT, rng=random.Random(4)
+    )
+    constraints = GroupConstraints(
+        style_counts={
+            BigFiveConflictResolutionStyle.DOMINATING: Bounds(maximum=1),
+            BigFiveConflictResolutionStyle.INTEGRATING: Bounds(minimum=2),
+        },
+        concern_for_self_counts={PriorityLevel.LOW: Bounds(maximum=3)},
+        trait_means={"agreeableness": Bounds(minimum=0.75)},
+    )
+
+    groups = select_groups(
+        population,
+        6,
+        count=2,
+        constraints=constraints,
+        rng=random.Random(1),
+        time_budget=None,
+        max_iterations=2_000,
+    )
+
+    assert len(groups) == 2
+    assert not set(groups[0].indices) & set(groups[1].indices)
+    agreeableness = population.trait_scores("agreeableness")
+    for group in groups:
+        assert group.feasible
+        styles = [population.conflict_style(index) for index in group.indices]
+        dominating = BigFiveConflictResolutionStyle.DOMINATING
+        integrating = BigFiveConflictResolutionStyle.INTEGRATING
+        assert styles.count(dominating) <= 1
+        assert styles.count(integrating) >= 2
+        mean = sum(agreeableness[index] for index in group.indices) / 6
+        assert mean >= 0.75
+
+
+def test_select_groups_follows_objective() -> None:
+    population = generate_population(
+        1_000, LifeStage.CHILD, rng=random.Random(8)
+    )
+    openness = population.trait_scores("openness")
+
+    (high,) = select_groups(
+        population,
+        5,
+        objective=GroupObjective(trait_mean_weights={"openness": 1.0}),
+        rng=random.Random(2),
+        time_budget=None,
+        max_iterations=1_000,
+    )
+
+    group_mean = sum(openness[index] for index in high.indices) / 5
+    assert group_mean > sum(openness) / len(openness)
+
+
+def test_select_groups_is_deterministic_for_seed() -> None:
+    population = generate_population(
+        500, LifeStage.ADULT, rng=random.Random(3)
+    )
+    objective = GroupObjective(trait_spread_weights={"neuroticism": 1.0})
+
+    first, second = (
+        select_groups(
+            population,
+            4,
+            objective=objective,
+            rng=random.Random(6),
+            time_budget=None,
+            max_iterations=500,
+        )
+        for _ in range(2)
+    )
+
+    assert first == second
+
+
+def test_select_groups_rejects_unknown_traits() -> None:
+    population = generate_population(10, LifeStage.ADULT)
+
+    with pytest.raises(ValueError, match="Unknown traits"):
+        select_groups(
+            population,
+            2,
+            objective=GroupObjective(trait_mean_weights={"charm": 1.0}),
+        )
+
+
+def test_select_groups_rejects_oversized_request() -> None:
+    population = generate_population(5, LifeStage.ADULT)
+
+    with pytest.raises(ValueError, match="too small"):
+        select_groups(population, 3, count=2)
+
+
+def test_select_groups_can_use_the_whole_population() -> None:
+    population = generate_population(
+        1_000, LifeStage.ADULT, rng=random.Random(9)
+    )
+    constraints = GroupConstraints(
+        style_counts={
+            BigFiveConflictResolutionStyle.INTEGRATING: Bounds(minimum=5)
+        }
+    )
+
+    selections = select_groups(
+        population,
+        100,
+        count=10,
+        constraints=constraints,
+        rng=random.Random(3),
+        max_iterations=0,
+    )
+
+    members = [index for group in selections for index in group.indices]
+    assert sorted(members) == list(range(1_000))
@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import personalitygen
+
+# Import time is dominated by which modules get loaded, so most checks guard
+# on that; the timing check below only uses a loose ceiling.
+_HEAVY_MODULES = (
+    "personalitygen.personality",
+    "personalitygen.traits",
+    "personalitygen.randomness",
+    "dataclasses",
+    "random",
+    "statistics",
+)
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    script = (
+        "import sys\n"
+        f"{statement}\n"
+        "print('\\n'.join(sorted(sys.modules)))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def _import_time_microseconds(statement: str) -> int:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    # Lines look like "import time: self | cumulative | name".
+    for line in result.stderr.splitlines():
+        fields = [part.strip() for part in line.split("|")]
+        if len(fields) == 3 and fields[2] == "personalitygen":
+            return int(fields[1])
+    raise AssertionError("personalitygen missing from -X importtime output")
+
+
+def test_package_import_defers_submodules() -> None:
+    loaded = _loaded_modules("import personalitygen")
+    assert not loaded.intersection(_HEAVY_MODULES)
+
+
+def test_enum_access_only_loads_enums() -> None:
+    loaded = _loaded_modules("from personalitygen import LifeStage")
+    assert "personalitygen.enums" in loaded
+    assert "personalitygen.personality" not in loaded
+
+
+def test_model_import_defers_sampling_machinery() -> None:
+    loaded = _loaded_modules("from personalitygen import BigFivePersonality")
+    assert "personalitygen.personality" in loaded
+    assert "statistics" not in loaded
+    assert "random" not in loaded
+
+
+def test_package_import_time_benchmark() -> None:
+    # Generous ceiling; the lazy package import is well under a millisecond.
+    assert _import_time_microseconds("import personalitygen") < 20_000
+
+
+def test_lazy_attributes_resolve_and_list() -> None:
+    from personalitygen.personality import BigFivePersonality
+
+    assert personalitygen.BigFivePersonality is BigFivePersonality
+    assert set(personalitygen.__all__) <= set(dir(personalitygen))
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="DoesNotExist"):
+        personalitygen.DoesNotExist
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from personalitygen.enums import LifeStage
+from personalitygen.interning import TraitInterner
+from personalitygen.personality import BigFivePersonality
+from personalitygen.population import Population, generate_population
+from personalitygen.traits import BigFiveOpenness
+
+
+def test_equal_quantized_traits_share_one_instance() -> None:
+    interner = TraitInterner(resolution=0.01)
+
+    first = interner.trait(BigFiveOpenness, (0.5012, 0.25, 0.7))
+    second = interner.trait(BigFiveOpenness, (0.4988, 0.2501, 0.70004))
+
+    assert first is second
+    assert first.aesthetic_sensitivity_score == 0.5
+    assert (interner.hits, interner.misses) == (1, 1)
+
+
+def test_quantized_personalities_share_instances() -> None:
+    interner = TraitInterner(resolution=0.1)
+    rng = random.Random(21)
+
+    personalities = [
+        interner.personality(LifeStage.ADULT, rng=rng) for _ in range(300)
+    ]
+
+    conflicts = {
+        id(personality.conflict_resolution_configuration)
+        for personality in personalities
+    }
+    openness = {
+        id(personality.trait_configuration.openness)
+        for personality in personalities
+    }
+    assert len(conflicts) <= 5
+    assert len(openness) < len(personalities)
+    assert interner.hits > 0
+
+
+def test_quantized_generation_matches_rounded_random() -> None:
+    interner = TraitInterner(resolution=0.01)
+
+    quantized = interner.personality(LifeStage.CHILD, rng=random.Random(3))
+    exact = BigFivePersonality.random(LifeStage.CHILD, rng=random.Random(3))
+
+    assert quantized.trait_configuration.neuroticism.anxiety_score == round(
+        exact.trait_configuration.neuroticism.anxiety_score, 2
+    )
+
+
+def test_interner_evicts_least_recently_used() -> None:
+    interner = TraitInterner(resolution=0.1, maxsize=2)
+
+    first = interner.trait(BigFiveOpenness, (0.1, 0.1, 0.1))
+    interner.trait(BigFiveOpenness, (0.2, 0.2, 0.2))
+    interner.trait(BigFiveOpenness, (0.1, 0.1, 0.1))
+    interner.trait(BigFiveOpenness, (0.3, 0.3, 0.3))
+
+    assert len(interner) == 2
+    assert interner.trait(BigFiveOpenness, (0.1, 0.1, 0.1)) is first
+    assert interner.misses == 3
+
+
+def test_population_views_are_interned() -> None:
+    population = generate_population(
+        50, LifeStage.ADULT, rng=random.Random(2)
+    )
+    interner = TraitInterner(resolution=0.5)
+
+    views = [
+        interner.population_personality(population, index)
+        for index in range(len(population))
+    ]
+
+    assert len({id(view.trait_configuration.openness) for view in views}) < 50
+
+
+def test_interner_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="resolution"):
+        TraitInterner(resolution=0.0)
+    with pytest.raises(ValueError, match="maxsize"):
+        TraitInterner(maxsize=0)
+
+
+def test_equal_quantized_personalities_are_one_object() -> None:
+    interner = TraitInterner(resolution=0.5)
+    rng = random.Random(5)
+
+    personalities = [
+        interner.personality(LifeStage.ADULT, rng=rng) for _ in range(200)
+    ]
+
+    distinct = {id(personality) for personality in personalities}
+    assert len(distinct) == len(set(personalities))
+    configurations = {
+        id(personality.trait_configuration)
+        for personality in personalities
+    }
+    assert len(configurations) == len(
+        {personality.trait_configuration for personality in personalities}
+    )
+
+
+def test_population_views_reuse_sampled_personalities() -> None:
+    interner = TraitInterner(resolution=0.5)
+    population = Population.from_personalities(
+        [interner.personality(LifeStage.CHILD, rng=random.Random(8))]
+    )
+
+    view = interner.population_personality(population, 0)
+
+    assert view is interner.personality(
+        LifeStage.CHILD, rng=random.Random(8)
+    )
+
+
+def test_lookups_do_not_hash_interned_traits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(self: object) -> int:
+        raise AssertionError("interned traits should not be hashed")
+
+    monkeypatch.setattr(BigFiveOpenness, "__hash__", fail)
+    interner = TraitInterner(resolution=0.5, maxsize=8)
+    rng = random.Random(11)
+
+    personalities = [
+        interner.personality(LifeStage.ADULT, rng=rng) for _ in range(100)
+    ]
+
+    # Tiny caches evict traits under cached parents; results stay valid.
+    openness = [
+        personality.trait_configuration.openness
+        for personality in personalities
+    ]
+    assert all(
+        0.0 <= trait.intellectual_curiosity_score <= 1.0 for trait in openness
+    )
+    assert interner.hits > 0
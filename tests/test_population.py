@@ -0,0 +1,131 @@
+import random
+import statistics
+
+import pytest
+
+from personalitygen.enums import LifeStage
+from personalitygen.personality import BigFivePersonality
+from personalitygen.population import (
+    SCORE_COLUMNS,
+    Population,
+    generate_population,
+    sample_life_stages,
+)
+
+
+def test_generate_population_is_deterministic_for_seed() -> None:
+    population_a = generate_population(
+        50, LifeStage.ADULT, rng=random.Random(5)
+    )
+    population_b = generate_population(
+        50, LifeStage.ADULT, rng=random.Random(5)
+    )
+
+    assert len(population_a) == 50
+    assert population_a == population_b
+
+
+def test_generate_population_scores_are_in_range() -> None:
+    population = generate_population(
+        200, LifeStage.CHILD, rng=random.Random(1)
+    )
+
+    for column in SCORE_COLUMNS:
+        values = population.columns[column]
+        assert all(0.01 <= value <= 1.0 for value in values)
+
+
+def test_population_round_trips_through_models() -> None:
+    rng = random.Random(11)
+    personalities = [
+        BigFivePersonality.random(LifeStage.YOUNG_ADULT, rng=rng)
+        for _ in range(5)
+    ]
+
+    population = Population.from_personalities(personalities)
+
+    assert list(population) == personalities
+    assert population.trait_scores("openness") == [
+        personality.trait_configuration.openness.score
+        for personality in personalities
+    ]
+
+
+def test_population_rejects_ragged_columns() -> None:
+    population = generate_population(3, LifeStage.ADULT, rng=random.Random(2))
+    columns = dict(population.columns)
+    columns[SCORE_COLUMNS[0]] = columns[SCORE_COLUMNS[0]][:2]
+
+    with pytest.raises(ValueError, match="equal length"):
+        Population(columns=columns, styles=population.styles)
+
+
+def test_generate_population_rejects_negative_count() -> None:
+    with pytest.raises(ValueError, match="count must be non-negative"):
+        generate_population(-1, LifeStage.ADULT)
+
+
+def test_population_ids_default_and_offset() -> None:
+    population = generate_population(3, LifeStage.ADULT, first_id=10)
+
+    assert list(population.ids) == [10, 11, 12]
+    assert list(Population.from_personalities(population).ids) == [0, 1, 2]
+
+
+def test_sample_life_stages_follows_mix_exactly() -> None:
+    stages = sample_life_stages(
+        10,
+        {LifeStage.CHILD: 20, LifeStage.YOUNG_ADULT: 30, LifeStage.ADULT: 50},
+        rng=random.Random(1),
+    )
+
+    assert stages.count(LifeStage.CHILD) == 2
+    assert stages.count(LifeStage.YOUNG_ADULT) == 3
+    assert stages.count(LifeStage.ADULT) == 5
+
+
+def test_mixed_population_keeps_per_agent_stage_order() -> None:
+    stages = [LifeStage.CHILD, LifeStage.ADULT] * 500
+
+    population = generate_population(
+        len(stages), stages, rng=random.Random(6)
+    )
+
+    openness = population.trait_scores("openness")
+    children = statistics.fmean(openness[0::2])
+    adults = statistics.fmean(openness[1::2])
+    # Child openness means sit about 0.2 above adult means.
+    assert children - adults > 0.1
+
+
+def test_mixed_population_matches_single_stage_draws() -> None:
+    uniform = generate_population(
+        20, LifeStage.YOUNG_ADULT, rng=random.Random(8)
+    )
+    per_agent = generate_population(
+        20, [LifeStage.YOUNG_ADULT] * 20, rng=random.Random(8)
+    )
+
+    assert per_agent == uniform
+
+
+def test_stage_mix_population_is_deterministic_for_seed() -> None:
+    mix = {LifeStage.CHILD: 1.0, LifeStage.ADULT: 3.0}
+
+    first = generate_population(40, mix, rng=random.Random(2))
+    second = generate_population(40, mix, rng=random.Random(2))
+
+    assert first == second
+
+
+def test_per_agent_stages_must_match_count() -> None:
+    with pytest.raises(ValueError, match="one entry per agent"):
+        generate_population(3, [LifeStage.ADULT])
+
+
+@pytest.mark.parametrize("weight", [-1.0, float("nan"), float("inf")])
+def test_sample_life_stages_rejects_bad_weights(weight: float) -> None:
+    with pytest.raises(ValueError, match="finite and non-negative"):
+        sample_life_stages(
+            4, {LifeStage.CHILD: weight, LifeStage.ADULT: 1.0}
+        )
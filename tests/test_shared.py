@@ -0,0 +1,94 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytest
+
+from personalitygen.diffing import diff_populations
+from personalitygen.enums import LifeStage
+from personalitygen.population import generate_population
+from personalitygen.shared import SharedPopulation
+
+
+def _worker_summary(shared: SharedPopulation) -> tuple[int, float, str]:
+    try:
+        population = shared.population
+        total = sum(population.columns["trust_score"])
+        style = shared.personality(0).conflict_resolution_configuration
+        return len(population), total, style.conflict_resolution_style.value
+    finally:
+        shared.close()
+
+
+def test_publish_and_attach_share_one_copy() -> None:
+    population = generate_population(
+        300, LifeStage.ADULT, rng=random.Random(1), first_id=40
+    )
+
+    with SharedPopulation.publish(population) as published:
+        attached = SharedPopulation.attach(published.name)
+        try:
+            assert attached.population == population
+            assert list(attached.population.ids) == list(population.ids)
+            assert attached.personality(7) == population.personality(7)
+            assert diff_populations(population, attached.population).is_empty
+        finally:
+            attached.close()
+
+
+def test_attached_columns_are_read_only() -> None:
+    population = generate_population(5, LifeStage.CHILD)
+
+    with SharedPopulation.publish(population) as published:
+        attached = SharedPopulation.attach(published.name)
+        try:
+            with pytest.raises(TypeError):
+                attached.population.columns["trust_score"][0] = 0.5
+        finally:
+            attached.close()
+
+
+def test_worker_processes_read_shared_population() -> None:
+    population = generate_population(
+        1_000, LifeStage.YOUNG_ADULT, rng=random.Random(2)
+    )
+    expected = (
+        len(population),
+        sum(population.columns["trust_score"]),
+        population.conflict_style(0).value,
+    )
+
+    with SharedPopulation.publish(population) as published:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_worker_summary, [published] * 2))
+
+    assert results == [expected, expected]
+
+
+def test_empty_population_can_be_shared() -> None:
+    population = generate_population(0, LifeStage.ADULT)
+
+    with SharedPopulation.publish(population) as published:
+        assert len(published) == 0
+
+
+def test_unlink_requires_publisher() -> None:
+    population = generate_population(2, LifeStage.ADULT)
+
+    with SharedPopulation.publish(population) as published:
+        attached = SharedPopulation.attach(published.name)
+        try:
+            with pytest.raises(ValueError, match="publishing handle"):
+                attached.unlink()
+        finally:
+            attached.close()
+
+
+def test_attach_rejects_foreign_blocks() -> None:
+    block = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError, match="does not hold"):
+            SharedPopulation.attach(block.name)
+    finally:
+        block.close()
+        block.unlink()
@@ -1,7 +1,19 @@
 import random
 
+import pytest
+
 from personalitygen.enums import LifeStage
 from personalitygen.personality import BigFiveTraitConfiguration
+from personalitygen.randomness import random_gaussian
+from personalitygen.traits import (
+    _CUSTOM_PLANS,
+    _CUSTOM_PLANS_MAXSIZE,
+    _OPENNESS_CONFIG,
+    _clear_sampling_plans,
+    _sample_trait,
+    _sampling_plan,
+    _TraitConfig,
+)
 
 
 def test_trait_configuration_is_deterministic_for_seed() -> None:
@@ -12,3 +24,54 @@ def test_trait_configuration_is_deterministic_for_seed() -> None:
     traits_b = BigFiveTraitConfiguration.random(LifeStage.ADULT, rng=rng_b)
 
     assert traits_a == traits_b
+
+
+def test_sampling_plans_are_reused_per_config_and_stage() -> None:
+    plan = _sampling_plan(_OPENNESS_CONFIG, LifeStage.CHILD)
+
+    assert _sampling_plan(_OPENNESS_CONFIG, LifeStage.CHILD) is plan
+    assert _sampling_plan(_OPENNESS_CONFIG, LifeStage.ADULT) is not plan
+
+
+def test_sampling_plan_matches_random_gaussian() -> None:
+    means = _OPENNESS_CONFIG.means_by_stage[LifeStage.ADULT]
+    rng = random.Random(9)
+    expected = tuple(
+        random_gaussian(
+            mean=mean,
+            stddev=_OPENNESS_CONFIG.stddev,
+            min_value=0.01,
+            max_value=1.0,
+            rng=rng,
+        )
+        for mean in means
+    )
+
+    sampled = _sample_trait(
+        LifeStage.ADULT, _OPENNESS_CONFIG, rng=random.Random(9)
+    )
+
+    assert sampled == expected
+
+
+def test_custom_config_plans_are_bounded_and_clearable() -> None:
+    configs = [
+        _TraitConfig(stddev=0.1, means_by_stage={LifeStage.ADULT: means})
+        for means in [(0.5, 0.5, 0.5)] * 200
+    ]
+    for config in configs:
+        _sample_trait(LifeStage.ADULT, config, rng=random.Random(1))
+
+    assert len(_CUSTOM_PLANS) <= _CUSTOM_PLANS_MAXSIZE
+
+    config = configs[-1]
+    plan = _sampling_plan(config, LifeStage.ADULT)
+    _clear_sampling_plans()
+    assert _sampling_plan(config, LifeStage.ADULT) is not plan
+
+
+def test_unsupported_life_stage_is_rejected() -> None:
+    config = _TraitConfig(stddev=0.1, means_by_stage={})
+
+    with pytest.raises(ValueError, match="Unsupported life stage"):
+        _sample_trait(LifeStage.ADULT, config)